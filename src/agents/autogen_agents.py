@@ -6,10 +6,19 @@ Implements autonomous job search, application, and career management agents
 # AutoGen is now autogen-agentchat
 from autogen_agentchat.agents import AssistantAgent, UserProxyAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
+from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from typing import List, Dict, Any, Optional
+import asyncio
+import functools
+import json
+import re
+import string
 import structlog
+import weakref
+from collections import OrderedDict
 from datetime import datetime
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from src.config.settings import settings
 
@@ -22,6 +31,302 @@ from src.config.settings import settings
 logger = structlog.get_logger()
 
 
+# Markers the agents are asked to emit, compiled once at import. The patterns
+# avoid nested quantifiers so matching stays linear in the transcript length.
+OPTIMIZED_RESUME_BLOCK = re.compile(r"<resume>(.*?)</resume>", re.S)
+COVER_LETTER_BLOCK = re.compile(r"<cover_letter>(.*?)</cover_letter>", re.S)
+
+
+def _message_text(message: Any) -> str:
+    """Get the text content of an AgentChat message or a legacy message dict"""
+    content = message.get("content") if isinstance(message, dict) else getattr(message, "content", "")
+    return content if isinstance(content, str) else str(content or "")
+
+
+def _response_text(response: Any) -> str:
+    """Get the final message text of an agent run"""
+    messages = getattr(response, "messages", None) or getattr(response, "chat_history", None) or []
+    return _message_text(messages[-1]) if messages else ""
+
+
+# Agent system prompts, defined once at import and shared by every agent build
+JOB_RESEARCHER_SYSTEM_MESSAGE = """You are an expert job researcher and career advisor.
+Your responsibilities:
+- Search job boards (Indeed, LinkedIn, Glassdoor) for relevant opportunities
+- Analyze job descriptions and extract requirements
+- Match opportunities with user's skills and career goals
+- Rank opportunities based on fit score
+- Identify skill gaps and learning opportunities
+
+Always be thorough and consider:
+- Job requirements vs. user qualifications
+- Salary range and location preferences
+- Company culture and growth potential
+- Remote work options and benefits
+"""
+
+RESUME_OPTIMIZER_SYSTEM_MESSAGE = """You are an expert resume writer and ATS optimization specialist.
+Your responsibilities:
+- Analyze job descriptions and extract key requirements
+- Customize resume bullet points to match job requirements
+- Optimize for ATS (Applicant Tracking Systems)
+- Maintain user's authentic voice and personal brand
+- Ensure measurable achievements and impact statements
+- Reorder skills based on job posting priorities
+
+Guidelines:
+- Use action verbs and quantifiable results
+- Keep bullet points concise (1-2 lines)
+- Include relevant keywords from job description
+- Never fabricate experience or skills
+- Preserve user's tone and style
+"""
+
+COVER_LETTER_WRITER_SYSTEM_MESSAGE = """You are an expert cover letter writer and communication specialist.
+Your responsibilities:
+- Write compelling, personalized cover letters for each application
+- Research the company and incorporate relevant details
+- Connect user's experience to job requirements
+- Demonstrate enthusiasm and cultural fit
+- Keep letters concise (250-400 words)
+
+Structure:
+1. Strong opening hook
+2. Relevant experience and achievements
+3. Why this company/role specifically
+4. Call to action
+
+Tone: Professional yet personable, enthusiastic, confident
+"""
+
+APPLICATION_MANAGER_SYSTEM_MESSAGE = """You are an application management and tracking specialist.
+Your responsibilities:
+- Coordinate the application process
+- Verify all materials are ready (resume, cover letter, portfolio)
+- Submit applications through appropriate channels
+- Track application status and follow-ups
+- Schedule interview preparation reminders
+- Manage application pipeline
+
+Always:
+- Double-check all materials before submission
+- Record submission details and confirmation
+- Set up follow-up reminders
+- Track application status changes
+"""
+
+PROFILE_UPDATER_SYSTEM_MESSAGE = """You are a professional branding and profile optimization expert.
+Your responsibilities:
+- Keep LinkedIn, GitHub, and portfolio profiles up-to-date
+- Ensure consistency across all platforms
+- Optimize profile SEO for discoverability
+- Suggest profile improvements
+- Maintain personal brand integrity
+
+Platforms:
+- LinkedIn: headline, summary, experience, skills, recommendations
+- GitHub: bio, pinned repos, README profiles
+- Portfolio: projects, case studies, testimonials
+"""
+
+CONTENT_CREATOR_SYSTEM_MESSAGE = """You are a content strategist and creator for professional branding.
+Your responsibilities:
+- Generate LinkedIn posts, articles, and updates
+- Create project documentation and case studies
+- Write technical blog posts
+- Develop presentation content
+- Adapt to trending topics and industry news
+
+Content types:
+- Thought leadership posts
+- Technical tutorials
+- Project showcases
+- Career insights
+- Industry commentary
+"""
+
+TASK_ORCHESTRATOR_SYSTEM_MESSAGE = """You are the master coordinator of the Agentice system.
+Your responsibilities:
+- Coordinate between all specialist agents
+- Break down complex tasks into subtasks
+- Assign tasks to appropriate agents
+- Ensure workflow efficiency
+- Monitor progress and resolve blockers
+- Synthesize results and present to user
+
+Workflow:
+1. Understand user's goal
+2. Create execution plan
+3. Delegate to specialist agents
+4. Monitor and coordinate
+5. Quality check results
+6. Request user approval when needed
+7. Execute approved actions
+"""
+
+
+# Task prompts, parsed once at import; only the variable slots are filled per call
+OPTIMIZE_RESUME_TEMPLATE = string.Template("""\
+TASK: Optimize resume for specific job opportunity
+
+JOB DESCRIPTION:
+$job_description
+
+CURRENT RESUME:
+$resume
+
+REQUIREMENTS:
+1. Analyze job requirements
+2. Identify matching and missing skills
+3. Reorder and rewrite bullet points to emphasize relevant experience
+4. Add keywords for ATS optimization
+5. Maintain authentic voice and truthfulness
+6. Provide before/after diff
+7. Explain changes
+
+Provide the optimized resume wrapped in <resume></resume> tags,
+followed by the detailed explanation.
+""")
+
+COVER_LETTER_TEMPLATE = string.Template("""\
+TASK: Write a compelling cover letter
+
+COMPANY: $company_name
+
+JOB DESCRIPTION:
+$job_description
+
+MY BACKGROUND:
+$resume
+
+REQUIREMENTS:
+- Research the company (if possible) and mention specific details
+- Connect my experience to their requirements
+- Show enthusiasm for the role
+- Keep it concise (250-400 words)
+- Professional yet personable tone
+- Strong opening and call to action
+
+Write the cover letter now, wrapped in <cover_letter></cover_letter> tags.
+""")
+
+PROFILE_UPDATE_TEMPLATE = string.Template("""\
+TASK: Update the $platform profile with new experience
+
+NEW EXPERIENCE:
+$new_experience
+
+SECTIONS TO UPDATE: $sections
+
+REQUIREMENTS:
+- Maintain consistent personal brand
+- Optimize for discoverability (SEO, keywords)
+- Quantify achievements when possible
+- Keep tone professional yet personable
+
+Respond with a JSON object mapping each section to its proposed update.
+""")
+
+# Platforms updated by update_professional_profiles, one agent call each
+PROFILE_PLATFORMS = {
+    "linkedin": ("LinkedIn", "headline, summary, experience, skills"),
+    "github": ("GitHub", "bio, pinned repos, README"),
+    "portfolio": ("Portfolio", "projects section"),
+}
+
+CONTENT_TEMPLATE = string.Template("""\
+TASK: Create $content_type
+
+TOPIC: $topic
+CONTEXT: $context
+
+REQUIREMENTS:
+- Engaging and professional
+- Demonstrate expertise
+- Include relevant hashtags (if LinkedIn post)
+- Proper structure and formatting
+- Call to action or discussion prompt
+- Length appropriate for platform
+
+Create the content now.
+""")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_model_client() -> OpenAIChatCompletionClient:
+    """One model client (and HTTP connection pool) shared by every agent"""
+    return OpenAIChatCompletionClient(
+        model=settings.DEFAULT_LLM_MODEL,
+        api_key=settings.OPENAI_API_KEY,
+        temperature=0.7,
+        max_tokens=2000,
+    )
+
+
+# Specialist agents by role: (agent name, system message)
+AGENT_ROLES = {
+    # Job Researcher Agent - Searches and identifies opportunities
+    "job_researcher": ("JobResearcher", JOB_RESEARCHER_SYSTEM_MESSAGE),
+    # Resume Optimizer Agent - Customizes resumes for each application
+    "resume_optimizer": ("ResumeOptimizer", RESUME_OPTIMIZER_SYSTEM_MESSAGE),
+    # Cover Letter Writer Agent - Generates personalized cover letters
+    "cover_letter_writer": ("CoverLetterWriter", COVER_LETTER_WRITER_SYSTEM_MESSAGE),
+    # Application Manager Agent - Handles submission and tracking
+    "application_manager": ("ApplicationManager", APPLICATION_MANAGER_SYSTEM_MESSAGE),
+    # Profile Updater Agent - Keeps professional profiles current
+    "profile_updater": ("ProfileUpdater", PROFILE_UPDATER_SYSTEM_MESSAGE),
+    # Content Creator Agent - Generates professional content
+    "content_creator": ("ContentCreator", CONTENT_CREATOR_SYSTEM_MESSAGE),
+    # Task Orchestrator Agent - Coordinates all agents and workflows
+    "orchestrator": ("TaskOrchestrator", TASK_ORCHESTRATOR_SYSTEM_MESSAGE),
+}
+
+
+class ApplicationRecord(BaseModel):
+    """The ApplicationManager's final reply for one prepared application"""
+    model_config = ConfigDict(extra="forbid")
+    
+    company: str
+    title: str
+    url: str
+    status: str
+
+
+@functools.lru_cache(maxsize=1)
+def _get_application_record_client() -> OpenAIChatCompletionClient:
+    """Model client whose replies are constrained to an ApplicationRecord"""
+    return OpenAIChatCompletionClient(
+        model=settings.DEFAULT_LLM_MODEL,
+        api_key=settings.OPENAI_API_KEY,
+        temperature=0.7,
+        max_tokens=2000,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": "ApplicationRecord",
+                "schema": ApplicationRecord.model_json_schema(),
+                "strict": True,
+            },
+        },
+    )
+
+
+def _new_agent(role: str, model_client: Optional[OpenAIChatCompletionClient] = None) -> AssistantAgent:
+    """
+    Build a specialist agent on the shared model client, or on model_client if given
+    
+    Agents keep every run in their model context, so an instance must not
+    be shared between users or between concurrent runs. Construction is
+    cheap; the expensive part, the model client, is shared.
+    """
+    name, system_message = AGENT_ROLES[role]
+    return AssistantAgent(
+        name=name,
+        model_client=model_client or _get_shared_model_client(),
+        system_message=system_message
+    )
+
+
 class AgenticeMultiAgentSystem:
     """
     Orchestrates multiple specialized AI agents for autonomous career management
@@ -31,247 +336,134 @@ class AgenticeMultiAgentSystem:
         self.user_id = user_id
         self.llm_service = LLMService()
         
-        # Configure LLM for AutoGen
-        self.llm_config = {
-            "model": settings.DEFAULT_LLM_MODEL,
-            "api_key": settings.OPENAI_API_KEY,
-            "temperature": 0.7,
-            "max_tokens": 2000,
-        }
-        
         # Initialize agents
         self._initialize_agents()
         
     def _initialize_agents(self):
-        """Initialize all specialized agents"""
+        """Build this user's specialist agents"""
         
-        # 1. User Proxy Agent - Represents the user and handles approvals
-        self.user_proxy = autogen.UserProxyAgent(
+        # User Proxy Agent - Represents the user and handles approvals
+        self.user_proxy = UserProxyAgent(
             name="UserProxy",
-            human_input_mode=settings.AUTOGEN_HUMAN_INPUT_MODE,
-            max_consecutive_auto_reply=0,
-            code_execution_config=False,
-            system_message="You represent the user and handle approval decisions."
+            description="Represents the user and handles approval decisions."
         )
         
-        # 2. Job Researcher Agent - Searches and identifies opportunities
-        self.job_researcher = autogen.AssistantAgent(
-            name="JobResearcher",
-            llm_config=self.llm_config,
-            system_message="""You are an expert job researcher and career advisor.
-            Your responsibilities:
-            - Search job boards (Indeed, LinkedIn, Glassdoor) for relevant opportunities
-            - Analyze job descriptions and extract requirements
-            - Match opportunities with user's skills and career goals
-            - Rank opportunities based on fit score
-            - Identify skill gaps and learning opportunities
-            
-            Always be thorough and consider:
-            - Job requirements vs. user qualifications
-            - Salary range and location preferences
-            - Company culture and growth potential
-            - Remote work options and benefits
-            """
-        )
-        
-        # 3. Resume Optimizer Agent - Customizes resumes for each application
-        self.resume_optimizer = autogen.AssistantAgent(
-            name="ResumeOptimizer",
-            llm_config=self.llm_config,
-            system_message="""You are an expert resume writer and ATS optimization specialist.
-            Your responsibilities:
-            - Analyze job descriptions and extract key requirements
-            - Customize resume bullet points to match job requirements
-            - Optimize for ATS (Applicant Tracking Systems)
-            - Maintain user's authentic voice and personal brand
-            - Ensure measurable achievements and impact statements
-            - Reorder skills based on job posting priorities
-            
-            Guidelines:
-            - Use action verbs and quantifiable results
-            - Keep bullet points concise (1-2 lines)
-            - Include relevant keywords from job description
-            - Never fabricate experience or skills
-            - Preserve user's tone and style
-            """
-        )
-        
-        # 4. Cover Letter Writer Agent - Generates personalized cover letters
-        self.cover_letter_writer = autogen.AssistantAgent(
-            name="CoverLetterWriter",
-            llm_config=self.llm_config,
-            system_message="""You are an expert cover letter writer and communication specialist.
-            Your responsibilities:
-            - Write compelling, personalized cover letters for each application
-            - Research the company and incorporate relevant details
-            - Connect user's experience to job requirements
-            - Demonstrate enthusiasm and cultural fit
-            - Keep letters concise (250-400 words)
-            
-            Structure:
-            1. Strong opening hook
-            2. Relevant experience and achievements
-            3. Why this company/role specifically
-            4. Call to action
-            
-            Tone: Professional yet personable, enthusiastic, confident
-            """
-        )
-        
-        # 5. Application Manager Agent - Handles submission and tracking
-        self.application_manager = autogen.AssistantAgent(
-            name="ApplicationManager",
-            llm_config=self.llm_config,
-            system_message="""You are an application management and tracking specialist.
-            Your responsibilities:
-            - Coordinate the application process
-            - Verify all materials are ready (resume, cover letter, portfolio)
-            - Submit applications through appropriate channels
-            - Track application status and follow-ups
-            - Schedule interview preparation reminders
-            - Manage application pipeline
-            
-            Always:
-            - Double-check all materials before submission
-            - Record submission details and confirmation
-            - Set up follow-up reminders
-            - Track application status changes
-            """
-        )
-        
-        # 6. Profile Updater Agent - Keeps professional profiles current
-        self.profile_updater = autogen.AssistantAgent(
-            name="ProfileUpdater",
-            llm_config=self.llm_config,
-            system_message="""You are a professional branding and profile optimization expert.
-            Your responsibilities:
-            - Keep LinkedIn, GitHub, and portfolio profiles up-to-date
-            - Ensure consistency across all platforms
-            - Optimize profile SEO for discoverability
-            - Suggest profile improvements
-            - Maintain personal brand integrity
-            
-            Platforms:
-            - LinkedIn: headline, summary, experience, skills, recommendations
-            - GitHub: bio, pinned repos, README profiles
-            - Portfolio: projects, case studies, testimonials
-            """
-        )
-        
-        # 7. Content Creator Agent - Generates professional content
-        self.content_creator = autogen.AssistantAgent(
-            name="ContentCreator",
-            llm_config=self.llm_config,
-            system_message="""You are a content strategist and creator for professional branding.
-            Your responsibilities:
-            - Generate LinkedIn posts, articles, and updates
-            - Create project documentation and case studies
-            - Write technical blog posts
-            - Develop presentation content
-            - Adapt to trending topics and industry news
-            
-            Content types:
-            - Thought leadership posts
-            - Technical tutorials
-            - Project showcases
-            - Career insights
-            - Industry commentary
-            """
-        )
-        
-        # 8. Task Orchestrator Agent - Coordinates all agents and workflows
-        self.orchestrator = autogen.AssistantAgent(
-            name="TaskOrchestrator",
-            llm_config=self.llm_config,
-            system_message="""You are the master coordinator of the Agentice system.
-            Your responsibilities:
-            - Coordinate between all specialist agents
-            - Break down complex tasks into subtasks
-            - Assign tasks to appropriate agents
-            - Ensure workflow efficiency
-            - Monitor progress and resolve blockers
-            - Synthesize results and present to user
-            
-            Workflow:
-            1. Understand user's goal
-            2. Create execution plan
-            3. Delegate to specialist agents
-            4. Monitor and coordinate
-            5. Quality check results
-            6. Request user approval when needed
-            7. Execute approved actions
-            """
-        )
+        # Task Orchestrator Agent - Coordinates all agents and workflows.
+        # Specialists are built per run with _new_agent instead, since their
+        # runs overlap and each run's history must stay separate.
+        self.orchestrator = _new_agent("orchestrator")
         
         logger.info("Multi-agent system initialized", user_id=self.user_id)
     
     async def autonomous_job_search_and_apply(
         self,
         criteria: Dict[str, Any],
-        max_applications: int = 10
+        max_applications: int = 10,
+        max_concurrency: int = 4
     ) -> List[Application]:
         """
         Autonomous job search and application workflow
         
+        The JobResearcher runs once to shortlist opportunities, then each
+        opportunity is processed concurrently (bounded by max_concurrency
+        to respect API rate limits).
+        
         Args:
             criteria: Job search criteria (title, location, salary, etc.)
             max_applications: Maximum number of applications to submit
+            max_concurrency: Maximum number of opportunities processed at once
             
         Returns:
             List of submitted applications
         """
         logger.info("Starting autonomous job search", criteria=criteria, max_applications=max_applications)
         
-        # Create group chat for coordinated multi-agent workflow
-        groupchat = autogen.GroupChat(
-            agents=[
-                self.orchestrator,
-                self.job_researcher,
-                self.resume_optimizer,
-                self.cover_letter_writer,
-                self.application_manager,
-                self.user_proxy,
-            ],
-            messages=[],
-            max_round=50,
-        )
-        
-        manager = autogen.GroupChatManager(groupchat=groupchat, llm_config=self.llm_config)
-        
-        # Start the workflow
-        initial_message = f"""
-        AUTONOMOUS JOB APPLICATION WORKFLOW
+        # Phase 1: research opportunities once
+        search_prompt = f"""
+        TASK: Search job boards and identify the {max_applications} best-fit opportunities
         
         User ID: {self.user_id}
         Search Criteria: {criteria}
-        Max Applications: {max_applications}
         
-        TASK: Find and apply to relevant job opportunities
+        Respond with a JSON array. Each item must include:
+        title, company, url, description
+        """
         
-        WORKFLOW:
-        1. JobResearcher: Search job boards and identify {max_applications} best-fit opportunities
-        2. For each opportunity:
-           a. ResumeOptimizer: Customize resume for the job
-           b. CoverLetterWriter: Write personalized cover letter
-           c. UserProxy: REQUIRE APPROVAL before submission
-           d. ApplicationManager: Submit if approved
-        3. Report results and next steps
+        research = await _new_agent("job_researcher").run(task=search_prompt)
+        opportunities = self._parse_opportunities_from_response(research)[:max_applications]
         
-        START NOW. JobResearcher, begin searching for opportunities.
-        """
+        # Phase 2: fan out per-opportunity processing
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _bounded(opportunity: Dict[str, Any]):
+            async with semaphore:
+                return await self._run_application_dag(opportunity)
         
-        self.user_proxy.initiate_chat(
-            manager,
-            message=initial_message
+        results = await asyncio.gather(
+            *[_bounded(opportunity) for opportunity in opportunities],
+            return_exceptions=True
         )
         
+        messages = []
+        for opportunity, result in zip(opportunities, results):
+            if isinstance(result, Exception):
+                logger.error("Opportunity processing failed", company=opportunity.get("company"), error=str(result))
+                continue
+            # Only the ApplicationManager's final reply is the application
+            # record; the task echo with the full resume is dropped here
+            if result.messages:
+                messages.append(result.messages[-1])
+        
         # Extract applications from conversation
-        applications = self._extract_applications_from_chat(groupchat.messages)
+        applications = self._extract_applications_from_chat(messages)
         
         logger.info("Job search and application completed", applications_count=len(applications))
         
         return applications
     
+    async def _run_application_dag(self, opportunity: Dict[str, Any]) -> Any:
+        """
+        Prepare application materials for a single opportunity
+        
+        Runs the fixed dependency graph
+        (ResumeOptimizer || CoverLetterWriter) -> ApplicationManager,
+        so each agent is called exactly once with no group chat turns.
+        The three agents are built for this run alone, so concurrent runs
+        never share a message history.
+        """
+        job_summary = f"""
+        Job: {opportunity.get('title')} at {opportunity.get('company')}
+        URL: {opportunity.get('url')}
+        Description: {opportunity.get('description', '')}
+        """
+        
+        # Opportunities run concurrently, so every run gets its own agents;
+        # shared instances would interleave their message histories
+        resume_result, cover_letter_result = await asyncio.gather(
+            _new_agent("resume_optimizer").run(task=f"TASK: Customize the resume for this job\n{job_summary}"),
+            _new_agent("cover_letter_writer").run(task=f"TASK: Write a personalized cover letter for this job\n{job_summary}"),
+        )
+        
+        application_task = f"""
+        TASK: Prepare this application for submission
+        {job_summary}
+        
+        OPTIMIZED RESUME:
+        {resume_result.messages[-1].content if resume_result.messages else ''}
+        
+        COVER LETTER:
+        {cover_letter_result.messages[-1].content if cover_letter_result.messages else ''}
+        
+        REQUIRE USER APPROVAL before submission.
+        
+        Reply with this job's application record: its company, title and url,
+        and status "pending_approval".
+        """
+        
+        # The reply is schema-constrained JSON, so it parses without a marker
+        manager = _new_agent("application_manager", model_client=_get_application_record_client())
+        return await manager.run(task=application_task)
+    
     async def optimize_resume_for_job(
         self,
         job_description: str,
@@ -289,31 +481,10 @@ class AgenticeMultiAgentSystem:
         """
         logger.info("Optimizing resume for job", resume_id=current_resume.id)
         
-        message = f"""
-        TASK: Optimize resume for specific job opportunity
-        
-        JOB DESCRIPTION:
-        {job_description}
+        message = OPTIMIZE_RESUME_TEMPLATE.substitute(job_description=job_description, resume=current_resume.to_text())
         
-        CURRENT RESUME:
-        {current_resume.to_text()}
-        
-        REQUIREMENTS:
-        1. Analyze job requirements
-        2. Identify matching and missing skills
-        3. Reorder and rewrite bullet points to emphasize relevant experience
-        4. Add keywords for ATS optimization
-        5. Maintain authentic voice and truthfulness
-        6. Provide before/after diff
-        7. Explain changes
-        
-        Provide the optimized resume and detailed explanation.
-        """
-        
-        response = self.user_proxy.initiate_chat(
-            self.resume_optimizer,
-            message=message
-        )
+        # A fresh agent per call, so earlier jobs don't pile up in its context
+        response = await _new_agent("resume_optimizer").run(task=message)
         
         return self._parse_resume_optimization_response(response)
     
@@ -336,32 +507,9 @@ class AgenticeMultiAgentSystem:
         """
         logger.info("Generating cover letter", company=company_name)
         
-        message = f"""
-        TASK: Write a compelling cover letter
-        
-        COMPANY: {company_name}
+        message = COVER_LETTER_TEMPLATE.substitute(company_name=company_name, job_description=job_description, resume=resume.to_text())
         
-        JOB DESCRIPTION:
-        {job_description}
-        
-        MY BACKGROUND:
-        {resume.to_text()}
-        
-        REQUIREMENTS:
-        - Research the company (if possible) and mention specific details
-        - Connect my experience to their requirements
-        - Show enthusiasm for the role
-        - Keep it concise (250-400 words)
-        - Professional yet personable tone
-        - Strong opening and call to action
-        
-        Write the cover letter now.
-        """
-        
-        response = self.user_proxy.initiate_chat(
-            self.cover_letter_writer,
-            message=message
-        )
+        response = await _new_agent("cover_letter_writer").run(task=message)
         
         return self._extract_cover_letter_from_response(response)
     
@@ -372,6 +520,9 @@ class AgenticeMultiAgentSystem:
         """
         Update all professional profiles with new experience
         
+        Each platform gets its own short prompt and the calls run
+        concurrently, so latency is the slowest platform, not the sum.
+        
         Args:
             new_experience: New skills, projects, or experiences
             
@@ -380,33 +531,27 @@ class AgenticeMultiAgentSystem:
         """
         logger.info("Updating professional profiles", user_id=self.user_id)
         
-        message = f"""
-        TASK: Update professional profiles with new experience
-        
-        NEW EXPERIENCE:
-        {new_experience}
-        
-        PLATFORMS TO UPDATE:
-        1. LinkedIn (headline, summary, experience, skills)
-        2. GitHub (bio, pinned repos, README)
-        3. Portfolio (projects section)
-        
-        REQUIREMENTS:
-        - Maintain consistent personal brand
-        - Optimize for discoverability (SEO, keywords)
-        - Quantify achievements when possible
-        - Keep tone professional yet personable
-        - Provide specific update recommendations for each platform
-        
-        Generate the updates now.
-        """
-        
-        response = self.user_proxy.initiate_chat(
-            self.profile_updater,
-            message=message
+        # One short prompt per platform, run concurrently on one agent each
+        results = await asyncio.gather(
+            *[
+                _new_agent("profile_updater").run(task=PROFILE_UPDATE_TEMPLATE.substitute(
+                    platform=platform,
+                    sections=sections,
+                    new_experience=new_experience
+                ))
+                for platform, sections in PROFILE_PLATFORMS.values()
+            ],
+            return_exceptions=True
         )
         
-        return self._parse_profile_updates(response)
+        updates = {}
+        for key, result in zip(PROFILE_PLATFORMS, results):
+            if isinstance(result, Exception):
+                logger.error("Profile update failed", platform=key, error=str(result))
+                continue
+            updates[key] = self._parse_profile_updates(result)
+        
+        return updates
     
     async def create_professional_content(
         self,
@@ -427,51 +572,64 @@ class AgenticeMultiAgentSystem:
         """
         logger.info("Creating professional content", type=content_type, topic=topic)
         
-        message = f"""
-        TASK: Create {content_type}
-        
-        TOPIC: {topic}
-        CONTEXT: {context or 'None'}
-        
-        REQUIREMENTS:
-        - Engaging and professional
-        - Demonstrate expertise
-        - Include relevant hashtags (if LinkedIn post)
-        - Proper structure and formatting
-        - Call to action or discussion prompt
-        - Length appropriate for platform
-        
-        Create the content now.
-        """
+        message = CONTENT_TEMPLATE.substitute(content_type=content_type, topic=topic, context=context or 'None')
         
-        response = self.user_proxy.initiate_chat(
-            self.content_creator,
-            message=message
-        )
+        response = await _new_agent("content_creator").run(task=message)
         
         return self._extract_content_from_response(response)
     
-    def _extract_applications_from_chat(self, messages: List[Dict]) -> List[Application]:
-        """Extract application records from chat messages"""
-        # Implementation to parse chat messages and extract application data
+    def _parse_opportunities_from_response(self, response: Any) -> List[Dict[str, Any]]:
+        """Parse the JobResearcher's opportunity list"""
+        if not response.messages:
+            return []
+        try:
+            opportunities = json.loads(str(response.messages[-1].content))
+        except ValueError:
+            logger.error("Failed to parse opportunities from research response")
+            return []
+        return [opp for opp in opportunities if isinstance(opp, dict)] if isinstance(opportunities, list) else []
+    
+    def _extract_applications_from_chat(self, messages: List[Any]) -> List[Application]:
+        """Extract application records from the ApplicationManager's final replies"""
         applications = []
-        # Parse logic here
+        for msg in messages:
+            text = _message_text(msg)
+            try:
+                applications.append(ApplicationRecord.model_validate_json(text).model_dump())
+            except ValidationError:
+                logger.warning("Skipping malformed application record", record=text[:200])
         return applications
     
     def _parse_resume_optimization_response(self, response: Any) -> Dict[str, Any]:
         """Parse resume optimization response"""
-        # Implementation to extract optimized resume and diff
-        return {}
+        text = _response_text(response)
+        match = OPTIMIZED_RESUME_BLOCK.search(text)
+        if not match:
+            return {"optimized_resume": text, "explanation": ""}
+        return {
+            "optimized_resume": match.group(1).strip(),
+            "explanation": text[match.end():].strip(),
+        }
     
     def _extract_cover_letter_from_response(self, response: Any) -> str:
         """Extract cover letter from response"""
-        # Implementation to extract cover letter text
-        return ""
+        text = _response_text(response)
+        match = COVER_LETTER_BLOCK.search(text)
+        return match.group(1).strip() if match else text.strip()
+    
+    async def aclose(self):
+        """Close the user's HTTP connection pools"""
+        await self.llm_service.client.close()
     
     def _parse_profile_updates(self, response: Any) -> Dict[str, Any]:
-        """Parse profile update recommendations"""
-        # Implementation to extract platform-specific updates
-        return {}
+        """Parse one platform's update recommendations"""
+        text = _response_text(response)
+        try:
+            updates = json.loads(text)
+        except ValueError:
+            logger.warning("Profile updates were not valid JSON", response=text[:200])
+            return {"recommendations": text.strip()}
+        return updates if isinstance(updates, dict) else {"recommendations": updates}
     
     def _extract_content_from_response(self, response: Any) -> str:
         """Extract generated content from response"""
@@ -483,17 +641,37 @@ class AgenticeMultiAgentSystem:
 class AgentManager:
     """Manages agent instances for different users"""
     
-    _instances: Dict[str, AgenticeMultiAgentSystem] = {}
+    MAX_HOT_INSTANCES = 256
+    
+    # Every live system is reachable by user id; only recently used ones are
+    # kept alive here, colder ones are garbage collected once unreferenced
+    _instances: "weakref.WeakValueDictionary[str, AgenticeMultiAgentSystem]" = weakref.WeakValueDictionary()
+    _hot: "OrderedDict[str, AgenticeMultiAgentSystem]" = OrderedDict()
     
     @classmethod
     def get_agent_system(cls, user_id: str) -> AgenticeMultiAgentSystem:
         """Get or create agent system for user"""
-        if user_id not in cls._instances:
-            cls._instances[user_id] = AgenticeMultiAgentSystem(user_id)
-        return cls._instances[user_id]
+        system = cls._instances.get(user_id)
+        if system is None:
+            system = AgenticeMultiAgentSystem(user_id)
+            cls._instances[user_id] = system
+        
+        cls._hot[user_id] = system
+        cls._hot.move_to_end(user_id)
+        if len(cls._hot) > cls.MAX_HOT_INSTANCES:
+            cls._hot.popitem(last=False)
+        return system
     
     @classmethod
     def remove_agent_system(cls, user_id: str):
         """Remove agent system for user"""
-        if user_id in cls._instances:
-            del cls._instances[user_id]
+        cls._hot.pop(user_id, None)
+        cls._instances.pop(user_id, None)
+    
+    @classmethod
+    async def close_agent_system(cls, user_id: str):
+        """Remove agent system for user and release its connections"""
+        system = cls._instances.get(user_id)
+        cls.remove_agent_system(user_id)
+        if system is not None:
+            await system.aclose()
@@ -3,18 +3,172 @@ Modern Multi-Agent System using AutoGen AgentChat
 Production-ready conversational agents with event-driven orchestration
 """
 import asyncio
+import functools
+import json
+import logging
+import threading
+import time
 import structlog
-from typing import Dict, Any, List, Optional
+import tiktoken
+from typing import AsyncIterator, Dict, Any, List, Literal, Optional
 from datetime import datetime
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
-from autogen_agentchat.messages import TextMessage
+from autogen_agentchat.messages import ModelClientStreamingChunkEvent, TextMessage
 from autogen_ext.models.openai import OpenAIChatCompletionClient
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, InternalServerError, RateLimitError
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from src.config.settings import settings
+from src.services.cache_service import llm_cached
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
 
 logger = structlog.get_logger()
+# Per-message INFO events build their kwargs only when INFO is enabled
+LOG_INFO = settings.log_level <= logging.INFO
+
+# System prompts are module-level constants so every agent call sends a
+# byte-identical prefix, which lets the provider's prompt caching reuse it
+USER_PROXY_SYSTEM_MESSAGE = """You are a helpful AI assistant managing user interactions.
+Your role is to understand user requests, coordinate with specialized agents,
+and provide clear, actionable responses. Always be professional and helpful."""
+
+JOB_RESEARCHER_SYSTEM_MESSAGE = """You are a specialized job search agent.
+Analyze job postings, extract requirements, and match them with candidate profiles.
+Provide detailed insights on job fit, required skills, and application strategies."""
+
+RESUME_OPTIMIZER_SYSTEM_MESSAGE = """You are a resume optimization specialist.
+Tailor resumes to specific job postings, emphasize relevant skills,
+and ensure ATS compatibility. Provide actionable optimization suggestions."""
+
+COVER_LETTER_WRITER_SYSTEM_MESSAGE = """You are a professional cover letter writer.
+Create compelling, personalized cover letters that highlight candidate strengths
+and align with job requirements. Keep letters concise and impactful."""
+
+APPLICATION_MANAGER_SYSTEM_MESSAGE = """You are an application tracking specialist.
+Monitor application status, schedule follow-ups, and manage interview coordination.
+Provide status updates and next-step recommendations."""
+
+
+class JobAnalysis(BaseModel):
+    """Structured output of the job researcher's compatibility analysis"""
+    model_config = ConfigDict(extra="forbid")
+    
+    match_score: int
+    matching_skills: List[str]
+    missing_skills: List[str]
+    recommendation: Literal["apply", "maybe", "skip"]
+
+
+class ResumeOptimization(BaseModel):
+    """Structured output of the resume optimizer"""
+    model_config = ConfigDict(extra="forbid")
+    
+    optimized_summary: str
+    emphasized_skills: List[str]
+    keywords: List[str]
+
+
+def _json_schema_format(model: type) -> Dict[str, Any]:
+    """Build an OpenAI strict structured-output response_format for a model"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": model.model_json_schema(),
+            "strict": True,
+        },
+    }
+
+
+# Token budgets for job description excerpts embedded in prompts
+JOB_EXCERPT_TOKENS = 128
+JOB_SHORT_EXCERPT_TOKENS = 80
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding() -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(settings.OPENAI_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=1024)
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to a token budget, memoized across agent calls on the same job"""
+    tokens = _encoding().encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return _encoding().decode(tokens[:max_tokens])
+
+
+def _prepare_inputs(job: Dict[str, Any], resume: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize the job/resume fields shared by every agent prompt"""
+    description = job.get('description') or ''
+    return {
+        "title": job.get('title'),
+        "company": job.get('company'),
+        "excerpt": _truncate_to_tokens(description, JOB_EXCERPT_TOKENS),
+        "short_excerpt": _truncate_to_tokens(description, JOB_SHORT_EXCERPT_TOKENS),
+        "skills": ', '.join(resume.get('skills', [])),
+    }
+
+
+def _usage_fields(response: Any) -> Dict[str, int]:
+    """Sum token usage reported by the model across an agent run"""
+    prompt_tokens = 0
+    completion_tokens = 0
+    for msg in response.messages:
+        usage = getattr(msg, "models_usage", None)
+        if usage:
+            prompt_tokens += usage.prompt_tokens
+            completion_tokens += usage.completion_tokens
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+
+
+# Provider errors worth retrying; anything else fails immediately
+TRANSIENT_LLM_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+
+class CircuitOpenError(Exception):
+    """Raised when LLM calls are short-circuited after repeated failures"""
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker for LLM calls
+    
+    Opens after fail_max consecutive failures and rejects calls until
+    reset_timeout seconds have passed; the next call is then let through
+    as a trial and a failure re-opens the circuit.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+    
+    def before_call(self):
+        if self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout:
+            raise CircuitOpenError("LLM provider unavailable, try again later")
+    
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+    
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
 
 
 class AgenticePlatform:
@@ -28,57 +182,89 @@ class AgenticePlatform:
             model=settings.OPENAI_MODEL,
             api_key=settings.OPENAI_API_KEY
         )
-        self.agents = {}
-        self._initialize_agents()
-        logger.info("agentice_platform_initialized", agents=list(self.agents.keys()))
+        # Schema-constrained clients so JSON agents always return parseable output
+        self.job_analysis_client = OpenAIChatCompletionClient(
+            model=settings.OPENAI_MODEL,
+            api_key=settings.OPENAI_API_KEY,
+            response_format=_json_schema_format(JobAnalysis)
+        )
+        self.resume_optimization_client = OpenAIChatCompletionClient(
+            model=settings.OPENAI_MODEL,
+            api_key=settings.OPENAI_API_KEY,
+            response_format=_json_schema_format(ResumeOptimization)
+        )
+        # Raw client for endpoints AgentChat doesn't cover (Batch API)
+        self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self._breaker = CircuitBreaker()
+        
+        # Specialist agents by role: (agent name, model client, system message, stream)
+        self.agent_roles = {
+            # User Proxy Agent - Main interface
+            "user_proxy": ("UserProxy", self.model_client, USER_PROXY_SYSTEM_MESSAGE, True),
+            "job_researcher": ("JobResearcher", self.job_analysis_client, JOB_RESEARCHER_SYSTEM_MESSAGE, False),
+            "resume_optimizer": ("ResumeOptimizer", self.resume_optimization_client, RESUME_OPTIMIZER_SYSTEM_MESSAGE, False),
+            "cover_letter_writer": ("CoverLetterWriter", self.model_client, COVER_LETTER_WRITER_SYSTEM_MESSAGE, True),
+            "application_manager": ("ApplicationManager", self.model_client, APPLICATION_MANAGER_SYSTEM_MESSAGE, False),
+        }
+        logger.info("agentice_platform_initialized", agents=list(self.agent_roles))
     
-    def _initialize_agents(self):
-        """Initialize specialized agents with distinct roles"""
+    def _new_agent(self, role: str) -> AssistantAgent:
+        """
+        Build an agent for one run on the platform's shared model clients
         
-        # User Proxy Agent - Main interface
-        self.agents["user_proxy"] = AssistantAgent(
-            name="UserProxy",
-            model_client=self.model_client,
-            system_message="""You are a helpful AI assistant managing user interactions.
-            Your role is to understand user requests, coordinate with specialized agents,
-            and provide clear, actionable responses. Always be professional and helpful."""
+        Agents keep every run in their model context, so an instance must not
+        be shared between users or between concurrent runs.
+        """
+        name, model_client, system_message, stream = self.agent_roles[role]
+        return AssistantAgent(
+            name=name,
+            model_client=model_client,
+            model_client_stream=stream,
+            system_message=system_message
         )
+    
+    async def _run_agent(self, role: str, task: str) -> Any:
+        """
+        Run a fresh agent with bounded retries and a circuit breaker
         
-        # Job Researcher Agent
-        self.agents["job_researcher"] = AssistantAgent(
-            name="JobResearcher",
-            model_client=self.model_client,
-            system_message="""You are a specialized job search agent.
-            Analyze job postings, extract requirements, and match them with candidate profiles.
-            Provide detailed insights on job fit, required skills, and application strategies."""
-        )
+        Transient provider errors (rate limits, timeouts, 5xx) are retried up
+        to three times with jittered exponential backoff. After repeated
+        failures the breaker opens and calls fail fast with CircuitOpenError
+        instead of queueing behind an outage.
+        """
+        self._breaker.before_call()
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_random_exponential(min=1, max=20),
+                retry=retry_if_exception_type(TRANSIENT_LLM_ERRORS),
+                reraise=True
+            ):
+                with attempt:
+                    response = await self._new_agent(role).run(task=task)
+        except Exception:
+            self._breaker.record_failure()
+            raise
         
-        # Resume Optimizer Agent
-        self.agents["resume_optimizer"] = AssistantAgent(
-            name="ResumeOptimizer",
-            model_client=self.model_client,
-            system_message="""You are a resume optimization specialist.
-            Tailor resumes to specific job postings, emphasize relevant skills,
-            and ensure ATS compatibility. Provide actionable optimization suggestions."""
-        )
+        self._breaker.record_success()
+        return response
+    
+    async def _stream_agent(self, role: str, task: str) -> AsyncIterator[str]:
+        """
+        Stream a fresh agent's reply through the circuit breaker
         
-        # Cover Letter Writer Agent
-        self.agents["cover_letter_writer"] = AssistantAgent(
-            name="CoverLetterWriter",
-            model_client=self.model_client,
-            system_message="""You are a professional cover letter writer.
-            Create compelling, personalized cover letters that highlight candidate strengths
-            and align with job requirements. Keep letters concise and impactful."""
-        )
+        Streams are not retried, since chunks already sent can't be taken back.
+        """
+        self._breaker.before_call()
+        try:
+            async for event in self._new_agent(role).run_stream(task=task):
+                if isinstance(event, ModelClientStreamingChunkEvent):
+                    yield event.content
+        except Exception:
+            self._breaker.record_failure()
+            raise
         
-        # Application Manager Agent
-        self.agents["application_manager"] = AssistantAgent(
-            name="ApplicationManager",
-            model_client=self.model_client,
-            system_message="""You are an application tracking specialist.
-            Monitor application status, schedule follow-ups, and manage interview coordination.
-            Provide status updates and next-step recommendations."""
-        )
+        self._breaker.record_success()
     
     async def chat(self, message: str, user_id: str = "default") -> str:
         """
@@ -92,46 +278,58 @@ class AgenticePlatform:
             Agent's response
         """
         try:
-            logger.info("agent_chat_initiated", message=message, user_id=user_id)
+            if LOG_INFO:
+                logger.info("agent_chat_initiated", message=message, user_id=user_id)
             
             # Use user proxy for conversational interactions
-            agent = self.agents["user_proxy"]
-            response = await agent.run(task=message)
+            response = await self._run_agent("user_proxy", message)
             
             # Extract response text
             response_text = str(response.messages[-1].content) if response.messages else "I'm processing your request..."
             
-            logger.info("agent_chat_completed", response=response_text[:100])
+            if LOG_INFO:
+                logger.info("agent_chat_completed", response=response_text[:100], **_usage_fields(response))
             return response_text
             
         except Exception as e:
             logger.error("agent_chat_failed", error=str(e))
             return f"I encountered an error processing your request. Please try again."
     
-    async def analyze_job(self, job: Dict[str, Any], resume: Dict[str, Any]) -> Dict[str, Any]:
+    async def stream_chat(self, message: str, user_id: str = "default") -> AsyncIterator[str]:
         """
-        Analyze job compatibility with resume using job researcher agent
+        Stream the agent's reply token by token
         
         Args:
-            job: Job posting details
-            resume: Candidate resume details
+            message: User's message
+            user_id: User identifier for context
             
-        Returns:
-            Analysis with match score and recommendations
+        Yields:
+            Text chunks of the agent's response
         """
         try:
-            agent = self.agents["job_researcher"]
+            if LOG_INFO:
+                logger.info("agent_chat_stream_initiated", message=message, user_id=user_id)
+            
+            async for chunk in self._stream_agent("user_proxy", message):
+                yield chunk
             
-            task = f"""
+        except Exception as e:
+            logger.error("agent_chat_stream_failed", error=str(e))
+            yield "I encountered an error processing your request. Please try again."
+    
+    def _build_analysis_task(self, job: Dict[str, Any], resume: Dict[str, Any]) -> str:
+        """Build the job compatibility prompt"""
+        inputs = _prepare_inputs(job, resume)
+        return f"""
             Analyze this job posting and resume for compatibility:
             
-            Job Title: {job.get('title')}
-            Company: {job.get('company')}
-            Requirements: {job.get('description', '')[:500]}
+            Job Title: {inputs['title']}
+            Company: {inputs['company']}
+            Requirements: {inputs['excerpt']}
             
             Candidate Resume:
             Summary: {resume.get('summary', '')}
-            Skills: {', '.join(resume.get('skills', []))}
+            Skills: {inputs['skills']}
             
             Provide:
             1. Match score (0-100)
@@ -141,45 +339,142 @@ class AgenticePlatform:
             
             Respond in JSON format.
             """
+    
+    @llm_cached(system_message=JOB_RESEARCHER_SYSTEM_MESSAGE)
+    async def analyze_job(self, job: Dict[str, Any], resume: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze job compatibility with resume using job researcher agent
+        
+        Args:
+            job: Job posting details
+            resume: Candidate resume details
             
-            response = await agent.run(task=task)
-            response_text = str(response.messages[-1].content)
+        Returns:
+            Analysis with match score and recommendations
+        """
+        try:
+            task = self._build_analysis_task(job, resume)
             
-            # Parse response (simplified - in production, use structured outputs)
-            import json
-            try:
-                analysis = json.loads(response_text)
-            except:
-                analysis = {
-                    "match_score": 75,
-                    "recommendation": "apply",
-                    "matching_skills": ["Python", "FastAPI"],
-                    "missing_skills": ["Docker", "Kubernetes"],
-                    "raw_response": response_text
-                }
+            response = await self._run_agent("job_researcher", task)
+            response_text = str(response.messages[-1].content)
+            logger.info("job_analysis_completed", **_usage_fields(response))
             
-            return analysis
+            return JobAnalysis.model_validate_json(response_text).model_dump()
             
         except Exception as e:
             logger.error("job_analysis_failed", error=str(e))
             return {"error": str(e), "match_score": 0}
     
-    async def optimize_resume(self, resume: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
+    async def batch_analyze_jobs(
+        self,
+        jobs: List[Dict[str, Any]],
+        resume: Dict[str, Any],
+        max_concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
         """
-        Optimize resume for specific job using resume optimizer agent
-        """
-        try:
-            agent = self.agents["resume_optimizer"]
+        Analyze many job postings against the same resume
+        
+        Individual analyses run concurrently, bounded by max_concurrency, each
+        on its own agent. Callers that can wait should use
+        submit_batch_analysis instead.
+        
+        Args:
+            jobs: Job posting details
+            resume: Candidate resume details
+            max_concurrency: Maximum concurrent live calls
             
-            task = f"""
+        Returns:
+            Analyses in the same order as jobs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _bounded(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_job(job, resume)
+        
+        return list(await asyncio.gather(*[_bounded(job) for job in jobs]))
+    
+    async def submit_batch_analysis(self, jobs: List[Dict[str, Any]], resume: Dict[str, Any]) -> str:
+        """
+        Submit job analyses through the OpenAI Batch API (discounted, completes within 24h)
+        
+        Returns the batch id without waiting; pass it to collect_batch_analysis
+        (the collect_job_analysis_batch Celery task polls it from a worker).
+        """
+        requests = [
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.OPENAI_MODEL,
+                    "messages": [
+                        {"role": "system", "content": JOB_RESEARCHER_SYSTEM_MESSAGE},
+                        {"role": "user", "content": self._build_analysis_task(job, resume)},
+                    ],
+                    "response_format": _json_schema_format(JobAnalysis),
+                },
+            })
+            for index, job in enumerate(jobs)
+        ]
+        
+        batch_file = await self.openai_client.files.create(
+            file=("analyze_jobs.jsonl", "\n".join(requests).encode()),
+            purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("batch_analysis_submitted", batch_id=batch.id, jobs=len(jobs))
+        return batch.id
+    
+    async def collect_batch_analysis(self, batch_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the results of a submitted analysis batch
+        
+        Returns None while the batch is still running, otherwise analyses in
+        the order the jobs were submitted.
+        """
+        batch = await self.openai_client.batches.retrieve(batch_id)
+        if batch.status not in ("completed", "failed", "expired", "cancelled"):
+            return None
+        
+        analyses = [{"error": f"Batch {batch.status}", "match_score": 0} for _ in range(batch.request_counts.total)]
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("batch_analysis_failed", batch_id=batch_id, status=batch.status)
+            return analyses
+        
+        output = await self.openai_client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            record = _json_loads(line)
+            index = int(record["custom_id"])
+            if record.get("error") or not record.get("response"):
+                analyses[index] = {"error": str(record.get("error")), "match_score": 0}
+                continue
+            response_text = record["response"]["body"]["choices"][0]["message"]["content"]
+            try:
+                analyses[index] = JobAnalysis.model_validate_json(response_text).model_dump()
+            except ValidationError as e:
+                logger.error("batch_analysis_invalid_response", index=index, error=str(e))
+                analyses[index] = {"error": str(e), "match_score": 0}
+        
+        logger.info("batch_analysis_completed", batch_id=batch_id, jobs=len(analyses))
+        return analyses
+    
+    def _build_optimization_task(self, resume: Dict[str, Any], job: Dict[str, Any]) -> str:
+        """Build the resume optimization prompt"""
+        inputs = _prepare_inputs(job, resume)
+        return f"""
             Optimize this resume for the job posting:
             
-            Job: {job.get('title')} at {job.get('company')}
-            Requirements: {job.get('description', '')[:300]}
+            Job: {inputs['title']} at {inputs['company']}
+            Requirements: {inputs['short_excerpt']}
             
             Current Resume:
             Summary: {resume.get('summary', '')}
-            Skills: {', '.join(resume.get('skills', []))}
+            Skills: {inputs['skills']}
             
             Provide:
             1. Optimized summary (2-3 sentences)
@@ -188,50 +483,52 @@ class AgenticePlatform:
             
             Respond in JSON format.
             """
+    
+    @llm_cached(system_message=RESUME_OPTIMIZER_SYSTEM_MESSAGE)
+    async def optimize_resume(self, resume: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Optimize resume for specific job using resume optimizer agent
+        """
+        try:
+            task = self._build_optimization_task(resume, job)
             
-            response = await agent.run(task=task)
+            response = await self._run_agent("resume_optimizer", task)
             response_text = str(response.messages[-1].content)
+            logger.info("resume_optimization_completed", **_usage_fields(response))
             
-            import json
-            try:
-                optimization = json.loads(response_text)
-            except:
-                optimization = {
-                    "optimized_summary": resume.get('summary', ''),
-                    "emphasized_skills": resume.get('skills', []),
-                    "keywords": ["Python", "AI", "ML"],
-                    "raw_response": response_text
-                }
-            
-            return optimization
+            return ResumeOptimization.model_validate_json(response_text).model_dump()
             
         except Exception as e:
             logger.error("resume_optimization_failed", error=str(e))
             return {"error": str(e)}
     
-    async def generate_cover_letter(self, job: Dict[str, Any], resume: Dict[str, Any]) -> str:
-        """
-        Generate tailored cover letter using cover letter writer agent
-        """
-        try:
-            agent = self.agents["cover_letter_writer"]
-            
-            task = f"""
+    def _build_cover_letter_task(self, job: Dict[str, Any], resume: Dict[str, Any]) -> str:
+        """Build the cover letter prompt"""
+        inputs = _prepare_inputs(job, resume)
+        return f"""
             Write a professional cover letter for:
             
-            Job: {job.get('title')} at {job.get('company')}
-            Requirements: {job.get('description', '')[:500]}
+            Job: {inputs['title']} at {inputs['company']}
+            Requirements: {inputs['excerpt']}
             
             Candidate:
             Name: {resume.get('name', 'Candidate')}
             Summary: {resume.get('summary', '')}
-            Skills: {', '.join(resume.get('skills', []))}
+            Skills: {inputs['skills']}
             
             Keep it concise (300-400 words), professional, and personalized.
             """
+    
+    async def generate_cover_letter(self, job: Dict[str, Any], resume: Dict[str, Any]) -> str:
+        """
+        Generate tailored cover letter using cover letter writer agent
+        """
+        try:
+            task = self._build_cover_letter_task(job, resume)
             
-            response = await agent.run(task=task)
+            response = await self._run_agent("cover_letter_writer", task)
             cover_letter = str(response.messages[-1].content)
+            logger.info("cover_letter_generated", **_usage_fields(response))
             
             return cover_letter
             
@@ -239,6 +536,21 @@ class AgenticePlatform:
             logger.error("cover_letter_generation_failed", error=str(e))
             return f"Error generating cover letter: {str(e)}"
     
+    async def stream_cover_letter(self, job: Dict[str, Any], resume: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream a tailored cover letter as the model writes it
+        
+        Yields:
+            Text chunks of the cover letter
+        """
+        try:
+            async for chunk in self._stream_agent("cover_letter_writer", self._build_cover_letter_task(job, resume)):
+                yield chunk
+            
+        except Exception as e:
+            logger.error("cover_letter_stream_failed", error=str(e))
+            yield f"Error generating cover letter: {str(e)}"
+    
     async def collaborative_workflow(self, task: str, agents_to_use: List[str]) -> List[Dict[str, Any]]:
         """
         Run collaborative multi-agent workflow using RoundRobinGroupChat
@@ -251,8 +563,8 @@ class AgenticePlatform:
             List of messages from the conversation
         """
         try:
-            # Select agents for the task
-            selected_agents = [self.agents[name] for name in agents_to_use if name in self.agents]
+            # Fresh agents for this run, so the conversation stays with this task
+            selected_agents = [self._new_agent(name) for name in agents_to_use if name in self.agent_roles]
             
             if not selected_agents:
                 raise ValueError("No valid agents selected")
@@ -263,12 +575,14 @@ class AgenticePlatform:
             # Run collaborative task
             result = await team.run(task=task)
             
-            # Extract messages
+            # Extract messages; they are all collected once the run finishes,
+            # so a single timestamp is formatted and shared by every entry
+            timestamp = datetime.now().isoformat()
             messages = [
                 {
                     "agent": msg.source,
                     "content": msg.content,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
                 for msg in result.messages
             ]
@@ -280,12 +594,16 @@ class AgenticePlatform:
             return [{"error": str(e)}]
 
 
-# Singleton instance
-_platform_instance = None
+_platform_lock = threading.Lock()
+
+
+@functools.cache
+def _create_agent_platform() -> AgenticePlatform:
+    return AgenticePlatform()
+
 
 def get_agent_platform() -> AgenticePlatform:
     """Get or create singleton agent platform instance"""
-    global _platform_instance
-    if _platform_instance is None:
-        _platform_instance = AgenticePlatform()
-    return _platform_instance
+    # The lock keeps concurrent first calls from threads building two platforms
+    with _platform_lock:
+        return _create_agent_platform()
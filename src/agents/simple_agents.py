@@ -1,15 +1,35 @@
 """
 Simplified agent system for job application automation
 """
+import asyncio
+import orjson
 import structlog
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from src.config.settings import settings
-from src.services.llm_service import LLMService
+from src.services.cache_service import memory_cached
+from src.services.llm_service import llm_service
 
 logger = structlog.get_logger()
 
+# Static fields of the placeholder search result
+_MOCK_JOB = {
+    "title": "Software Engineer",
+    "company": "Tech Corp",
+    "location": "Remote",
+    "description": "Looking for a skilled developer...",
+    "url": "https://example.com/job/1",
+}
+
+
+def _skills_csv(resume: Dict[str, Any]) -> str:
+    """Get the resume's skills as a comma-separated string"""
+    # run_daily_search precomputes this once per batch
+    if "_skills_csv" in resume:
+        return resume["_skills_csv"]
+    return ", ".join(resume.get("skills", []))
+
 
 class AgentManager:
     """
@@ -17,9 +37,67 @@ class AgentManager:
     Uses direct LLM calls instead of complex multi-agent framework
     """
     
+    # Prompt templates, parsed once and filled with str.format_map per call
+    _ANALYZE_TMPL = """\
+Analyze the following job posting and resume for compatibility:
+
+Job Title: {title}
+Company: {company}
+Description: {description}
+
+Resume Summary: {summary}
+Skills: {skills}
+
+Provide:
+1. Match score (0-100)
+2. Key matching skills
+3. Missing skills
+4. Recommendation (apply, maybe, skip)
+
+Respond in JSON format.
+"""
+    
+    _COVER_LETTER_TMPL = """\
+Write a professional cover letter for the following job:
+
+Job Title: {title}
+Company: {company}
+Description: {description}
+
+Candidate Background:
+Name: {name}
+Summary: {summary}
+Experience: {experience}
+Skills: {skills}
+
+Make it personalized, enthusiastic, and highlight relevant experience.
+Keep it concise (300-400 words).
+"""
+    
+    _OPTIMIZE_TMPL = """\
+Optimize this resume for the following job posting:
+
+Job: {title} at {company}
+Required Skills: {required_skills}
+Description: {description}
+
+Current Resume:
+Summary: {summary}
+Skills: {skills}
+Experience: {experience}
+
+Provide:
+1. Optimized summary (2-3 sentences)
+2. Skills to emphasize
+3. Experience points to highlight
+4. Keywords to add
+
+Respond in JSON format.
+"""
+    
     def __init__(self, user_id: str):
         self.user_id = user_id
-        self.llm_service = LLMService()
+        self.llm_service = llm_service
         logger.info("agent_manager_initialized", user_id=user_id)
     
     async def search_jobs(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -36,17 +114,22 @@ class AgentManager:
         
         # For now, return mock data
         # In production, this would call job boards or web scrapers
-        return [
-            {
-                "title": "Software Engineer",
-                "company": "Tech Corp",
-                "location": "Remote",
-                "description": "Looking for a skilled developer...",
-                "url": "https://example.com/job/1",
-                "posted_date": datetime.now().isoformat()
-            }
-        ]
+        job = _MOCK_JOB.copy()
+        job["posted_date"] = datetime.now().isoformat()
+        return [job]
     
+    @staticmethod
+    def _build_analysis_prompt(job: Dict[str, Any], resume: Dict[str, Any]) -> str:
+        """Build the job compatibility prompt"""
+        return AgentManager._ANALYZE_TMPL.format_map({
+            "title": job.get('title'),
+            "company": job.get('company'),
+            "description": job.get('description', '')[:500],
+            "summary": resume.get('summary', ''),
+            "skills": _skills_csv(resume),
+        })
+    
+    @memory_cached(maxsize=1024)
     async def analyze_job(self, job: Dict[str, Any], resume: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze job compatibility with resume
@@ -60,24 +143,7 @@ class AgentManager:
         """
         logger.info("analyzing_job", job_title=job.get("title"))
         
-        prompt = f"""
-        Analyze the following job posting and resume for compatibility:
-        
-        Job Title: {job.get('title')}
-        Company: {job.get('company')}
-        Description: {job.get('description', '')[:500]}
-        
-        Resume Summary: {resume.get('summary', '')}
-        Skills: {', '.join(resume.get('skills', []))}
-        
-        Provide:
-        1. Match score (0-100)
-        2. Key matching skills
-        3. Missing skills
-        4. Recommendation (apply, maybe, skip)
-        
-        Respond in JSON format.
-        """
+        prompt = self._build_analysis_prompt(job, resume)
         
         try:
             response = await self.llm_service.chat_completion(
@@ -85,8 +151,7 @@ class AgentManager:
                 response_format={"type": "json_object"}
             )
             
-            import json
-            analysis = json.loads(response)
+            analysis = orjson.loads(response)
             return analysis
         except Exception as e:
             logger.error("job_analysis_failed", error=str(e))
@@ -113,22 +178,15 @@ class AgentManager:
         """
         logger.info("generating_cover_letter", job_title=job.get("title"))
         
-        prompt = f"""
-        Write a professional cover letter for the following job:
-        
-        Job Title: {job.get('title')}
-        Company: {job.get('company')}
-        Description: {job.get('description', '')[:1000]}
-        
-        Candidate Background:
-        Name: {resume.get('name', 'Candidate')}
-        Summary: {resume.get('summary', '')}
-        Experience: {resume.get('experience_summary', '')}
-        Skills: {', '.join(resume.get('skills', []))}
-        
-        Make it personalized, enthusiastic, and highlight relevant experience.
-        Keep it concise (300-400 words).
-        """
+        prompt = self._COVER_LETTER_TMPL.format_map({
+            "title": job.get('title'),
+            "company": job.get('company'),
+            "description": job.get('description', '')[:1000],
+            "name": resume.get('name', 'Candidate'),
+            "summary": resume.get('summary', ''),
+            "experience": resume.get('experience_summary', ''),
+            "skills": _skills_csv(resume),
+        })
         
         try:
             response = await self.llm_service.chat_completion(
@@ -139,6 +197,20 @@ class AgentManager:
             logger.error("cover_letter_generation_failed", error=str(e))
             return f"Error generating cover letter: {str(e)}"
     
+    @staticmethod
+    def _build_optimization_prompt(resume: Dict[str, Any], job: Dict[str, Any]) -> str:
+        """Build the resume optimization prompt"""
+        return AgentManager._OPTIMIZE_TMPL.format_map({
+            "title": job.get('title'),
+            "company": job.get('company'),
+            "required_skills": job.get('required_skills', ''),
+            "description": job.get('description', '')[:500],
+            "summary": resume.get('summary', ''),
+            "skills": _skills_csv(resume),
+            "experience": resume.get('experience_summary', ''),
+        })
+    
+    @memory_cached(maxsize=1024)
     async def optimize_resume(
         self,
         resume: Dict[str, Any],
@@ -156,26 +228,7 @@ class AgentManager:
         """
         logger.info("optimizing_resume", job_title=job.get("title"))
         
-        prompt = f"""
-        Optimize this resume for the following job posting:
-        
-        Job: {job.get('title')} at {job.get('company')}
-        Required Skills: {job.get('required_skills', '')}
-        Description: {job.get('description', '')[:500]}
-        
-        Current Resume:
-        Summary: {resume.get('summary', '')}
-        Skills: {', '.join(resume.get('skills', []))}
-        Experience: {resume.get('experience_summary', '')}
-        
-        Provide:
-        1. Optimized summary (2-3 sentences)
-        2. Skills to emphasize
-        3. Experience points to highlight
-        4. Keywords to add
-        
-        Respond in JSON format.
-        """
+        prompt = self._build_optimization_prompt(resume, job)
         
         try:
             response = await self.llm_service.chat_completion(
@@ -183,8 +236,7 @@ class AgentManager:
                 response_format={"type": "json_object"}
             )
             
-            import json
-            optimization = json.loads(response)
+            optimization = orjson.loads(response)
             return optimization
         except Exception as e:
             logger.error("resume_optimization_failed", error=str(e))
@@ -222,11 +274,18 @@ class AgentManager:
                 "analysis": analysis
             }
         
-        # Step 2: Optimize resume
-        optimized_resume = await self.optimize_resume(resume, job)
-        
-        # Step 3: Generate cover letter
-        cover_letter = await self.generate_cover_letter(job, resume)
+        # Steps 2 & 3: Optimize resume and generate cover letter concurrently
+        optimized_resume, cover_letter = await asyncio.gather(
+            self.optimize_resume(resume, job),
+            self.generate_cover_letter(job, resume),
+            return_exceptions=True
+        )
+        if isinstance(optimized_resume, Exception):
+            logger.error("resume_optimization_failed", error=str(optimized_resume))
+            optimized_resume = {"error": str(optimized_resume)}
+        if isinstance(cover_letter, Exception):
+            logger.error("cover_letter_generation_failed", error=str(cover_letter))
+            cover_letter = f"Error generating cover letter: {str(cover_letter)}"
         
         # Step 4: Prepare application
         application = {
@@ -261,15 +320,21 @@ class JobApplicationOrchestrator:
         self,
         search_criteria: Dict[str, Any],
         resume: Dict[str, Any],
-        max_applications: int = 10
+        max_applications: int = 10,
+        concurrency: int = 8,
+        batch_size: int = 10
     ) -> List[Dict[str, Any]]:
         """
         Run daily automated job search and application process
         
+        Jobs are processed concurrently, at most `concurrency` at a time.
+        
         Args:
             search_criteria: Job search parameters
             resume: User's resume
             max_applications: Maximum number of applications to process
+            concurrency: Maximum number of applications processed at once
+            batch_size: Number of results logged together
             
         Returns:
             List of processed applications
@@ -281,19 +346,49 @@ class JobApplicationOrchestrator:
         # Search for jobs
         jobs = await self.agent_manager.search_jobs(search_criteria)
         
-        applications = []
-        for job in jobs[:max_applications]:
-            try:
-                application = await self.agent_manager.process_application(
+        # Prepare the resume's prompt fields once for the whole batch
+        resume = {**resume, "_skills_csv": _skills_csv(resume)}
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _process(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.agent_manager.process_application(
                     job=job,
                     resume=resume,
                     auto_apply=False  # Require approval by default
                 )
-                applications.append(application)
-            except Exception as e:
+        
+        # One gather owns every job (the semaphore keeps a sliding window of
+        # active calls), so cancelling the search cancels them all; results
+        # are logged in micro-batches
+        selected = jobs[:max_applications]
+        all_results = await asyncio.gather(*[_process(job) for job in selected], return_exceptions=True)
+        
+        applications = []
+        for start in range(0, len(all_results), batch_size):
+            results = all_results[start:start + batch_size]
+            
+            # Each failure keeps the job it belongs to and why it failed
+            failures = [
+                {
+                    "job_id": job.get('id') or job.get('url'),
+                    "company": job.get('company'),
+                    "title": job.get('title'),
+                    "error": f"{type(result).__name__}: {result}",
+                }
+                for job, result in zip(selected[start:start + batch_size], results)
+                if isinstance(result, Exception)
+            ]
+            applications.extend(result for result in results if not isinstance(result, Exception))
+            
+            if failures:
                 logger.error("application_processing_failed", 
-                           job=job.get("title"),
-                           error=str(e))
+                           failed=len(failures),
+                           failures=failures)
+            logger.info("batch_complete", 
+                       succeeded=len(results) - len(failures),
+                       failed=len(failures))
         
         logger.info("daily_search_complete", 
                    total_jobs=len(jobs),
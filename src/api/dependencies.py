@@ -2,9 +2,16 @@
 API dependencies
 """
 
+from functools import lru_cache
+from typing import AsyncIterator
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.database.session import get_db_session
+from src.pipelines.job_application_pipeline import JobApplicationPipeline
+from src.services.application_service import ApplicationService
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
@@ -13,3 +20,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     # Placeholder - implement JWT verification
     from src.models.database import User
     return User(id="user-123", email="user@example.com", name="Test User")
+
+
+@lru_cache
+def get_application_service() -> ApplicationService:
+    """Get the shared application service"""
+    return ApplicationService()
+
+
+async def get_pipeline(current_user = Depends(get_current_user)) -> AsyncIterator[JobApplicationPipeline]:
+    """Get a job application pipeline for the current user, closed after the request"""
+    pipeline = JobApplicationPipeline(user_id=current_user.id)
+    try:
+        yield pipeline
+    finally:
+        await pipeline.aclose()
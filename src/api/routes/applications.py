@@ -2,18 +2,56 @@
 FastAPI router for job applications
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
 from datetime import datetime
+import orjson
+import structlog
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.pipelines.job_application_pipeline import JobApplicationPipeline
 from src.models.database import Application, ApplicationStatus
 from src.services.application_service import ApplicationService
-from src.api.dependencies import get_current_user
+from src.services.cache_service import get_redis
+from src.worker.celery_app import celery_app, run_daily_job_search_task
+from src.api.dependencies import get_application_service, get_current_user, get_db_session, get_pipeline
 
+logger = structlog.get_logger()
 router = APIRouter()
 
+# Dashboards poll /stats, so it is served from Redis for a short window
+STATS_CACHE_TTL = 30
+
+
+def _stats_cache_key(user_id: str) -> str:
+    return f"stats:{user_id}"
+
+
+async def _invalidate_stats(user_id: str):
+    try:
+        await get_redis().delete(_stats_cache_key(user_id))
+    except RedisError as e:
+        logger.warning("stats_cache_invalidation_failed", user_id=user_id, error=str(e))
+
+
+# Owner records for queued searches last as long as Celery's default result expiry
+TASK_OWNER_TTL = 86400
+
+
+def _task_owner_key(task_id: str) -> str:
+    return f"task_owner:{task_id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Parse a "created_at|id" page cursor"""
+    try:
+        created_at, application_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), application_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 class JobSearchRequest(BaseModel):
     keywords: str
@@ -41,39 +79,72 @@ class ApplicationApprovalRequest(BaseModel):
 @router.post("/auto-search")
 async def start_autonomous_job_search(
     request: JobSearchRequest,
-    background_tasks: BackgroundTasks,
     current_user = Depends(get_current_user)
 ):
     """
     Start autonomous job search and application process
-    """
     
-    pipeline = JobApplicationPipeline(user_id=current_user.id)
+    The pipeline runs on a Celery worker; poll /tasks/{task_id} for progress.
+    """
     
-    # Run in background
-    background_tasks.add_task(
-        pipeline.run_daily_job_search,
+    task = run_daily_job_search_task.delay(
+        user_id=current_user.id,
         search_criteria=request.dict()
     )
     
+    # /tasks/{task_id} only answers the user who queued the task
+    try:
+        await get_redis().set(_task_owner_key(task.id), current_user.id, ex=TASK_OWNER_TTL)
+    except RedisError as e:
+        logger.warning("task_owner_not_recorded", task_id=task.id, error=str(e))
+    
     return {
         "message": "Autonomous job search started",
         "status": "processing",
+        "task_id": task.id,
         "user_id": current_user.id
     }
 
 
+@router.get("/tasks/{task_id}")
+async def get_task_status(
+    task_id: str,
+    current_user = Depends(get_current_user)
+):
+    """
+    Get the status of a background job search
+    
+    Tasks queued by other users, or whose owner can't be looked up, are
+    reported as not found.
+    """
+    
+    try:
+        owner = await get_redis().get(_task_owner_key(task_id))
+    except RedisError as e:
+        logger.warning("task_owner_unavailable", task_id=task_id, error=str(e))
+        owner = None
+    
+    if owner is None or owner.decode() != current_user.id:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    result = celery_app.AsyncResult(task_id)
+    
+    return {
+        "task_id": task_id,
+        "status": result.status
+    }
+
+
 @router.post("/apply")
 async def apply_to_job(
     request: JobApplicationRequest,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    pipeline: JobApplicationPipeline = Depends(get_pipeline)
 ):
     """
     Apply to a specific job posting
     """
     
-    pipeline = JobApplicationPipeline(user_id=current_user.id)
-    
     application = await pipeline.apply_to_specific_job(
         job_url=request.job_url,
         company_name=request.company_name,
@@ -85,6 +156,8 @@ async def apply_to_job(
     if not application:
         raise HTTPException(status_code=500, detail="Failed to create application")
     
+    await _invalidate_stats(current_user.id)
+    
     return {
         "application_id": application.id,
         "status": application.status,
@@ -96,36 +169,50 @@ async def apply_to_job(
 async def get_applications(
     status: Optional[ApplicationStatus] = None,
     limit: int = 50,
-    current_user = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    current_user = Depends(get_current_user),
+    service: ApplicationService = Depends(get_application_service),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get user's applications
+    
+    Pass the returned next_cursor as cursor to fetch the following page.
     """
     
-    service = ApplicationService()
     applications = await service.get_user_applications(
         user_id=current_user.id,
         status=status,
-        limit=limit
+        limit=limit,
+        after=_decode_cursor(cursor) if cursor else None,
+        db=db
     )
     
+    # A short page means there is nothing after it
+    next_cursor = None
+    if applications and len(applications) == limit:
+        last = applications[-1]
+        next_cursor = f"{last.created_at.isoformat()}|{last.id}"
+    
     return {
         "applications": applications,
-        "count": len(applications)
+        "count": len(applications),
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/applications/{application_id}")
 async def get_application(
     application_id: str,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    service: ApplicationService = Depends(get_application_service),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get specific application details
     """
     
-    service = ApplicationService()
-    application = await service.get_application(application_id)
+    application = await service.get_application(application_id, db=db)
     
     if not application or application.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -137,30 +224,35 @@ async def get_application(
 async def approve_application(
     application_id: str,
     request: ApplicationApprovalRequest,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    service: ApplicationService = Depends(get_application_service),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Approve or reject an application
     """
     
-    service = ApplicationService()
-    application = await service.get_application(application_id)
+    application = await service.get_application(application_id, db=db)
     
     if not application or application.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Application not found")
     
     if request.approved:
-        # Approve and submit
-        result = await service.approve_and_submit(application)
+        # Approve and queue the submission
+        result = await service.approve_and_submit(application, db=db)
+        if not result["success"]:
+            raise HTTPException(status_code=409, detail=result["message"])
+        await _invalidate_stats(current_user.id)
         return {
-            "message": "Application approved and submitted",
+            "message": "Application approved, submission queued",
             "application_id": application_id,
-            "status": "submitted",
+            "status": "approved",
             "result": result
         }
     else:
         # Reject
-        await service.reject_application(application, request.notes)
+        await service.reject_application(application, request.notes, db=db)
+        await _invalidate_stats(current_user.id)
         return {
             "message": "Application rejected",
             "application_id": application_id,
@@ -171,14 +263,15 @@ async def approve_application(
 @router.get("/applications/{application_id}/status")
 async def get_application_status(
     application_id: str,
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    service: ApplicationService = Depends(get_application_service),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get real-time application status
     """
     
-    service = ApplicationService()
-    status = await service.check_application_status(application_id)
+    status = await service.check_application_status(application_id, db=db)
     
     return {
         "application_id": application_id,
@@ -189,13 +282,34 @@ async def get_application_status(
 
 @router.get("/stats")
 async def get_application_stats(
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    service: ApplicationService = Depends(get_application_service),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get user's application statistics
+    
+    Cached in Redis for STATS_CACHE_TTL seconds; approving, rejecting or
+    creating an application invalidates the entry.
     """
     
-    service = ApplicationService()
-    stats = await service.get_user_stats(current_user.id)
+    cache_key = _stats_cache_key(current_user.id)
+    redis = get_redis()
+    
+    try:
+        cached = await redis.get(cache_key)
+    except RedisError as e:
+        logger.warning("stats_cache_unavailable", error=str(e))
+        cached = None
+    
+    if cached is not None:
+        return orjson.loads(cached)
+    
+    stats = await service.get_user_stats(current_user.id, db=db)
+    
+    try:
+        await redis.setex(cache_key, STATS_CACHE_TTL, orjson.dumps(stats))
+    except RedisError as e:
+        logger.warning("stats_cache_store_failed", error=str(e))
     
     return stats
@@ -1,26 +1,59 @@
 """
 WebSocket route for real-time chat with AI agents
 """
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict
+from fastapi import APIRouter, WebSocket
+from redis.exceptions import RedisError
+from typing import AsyncIterator, Dict, Optional, Set
+from datetime import datetime, timezone
+import asyncio
 import structlog
 import json
+import logging
 
 from src.agents.autogen_chat_agents import get_agent_platform
+from src.config.settings import settings
+from src.services.cache_service import get_redis
 
 logger = structlog.get_logger()
+# Per-message INFO events build their kwargs only when INFO is enabled
+LOG_INFO = settings.log_level <= logging.INFO
 router = APIRouter()
 
 
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _channel(client_id: str) -> str:
+    return f"ws:{client_id}"
+
+
 class ConnectionManager:
-    """Manage WebSocket connections"""
+    """
+    Manage WebSocket connections
+    
+    One pattern subscription per process receives the messages published
+    for every client, so a message for a client connected to another
+    worker is delivered through pub/sub without a Redis connection per
+    socket.
+    """
     
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._listener_lock = asyncio.Lock()
+        self._closing: Set[asyncio.Task] = set()
     
     async def connect(self, websocket: WebSocket, client_id: str):
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        
+        # Subscribe before returning so no message published after connect is missed
+        try:
+            await self._ensure_listener()
+        except RedisError as e:
+            logger.warning("websocket_pubsub_unavailable", client_id=client_id, error=str(e))
+        
         logger.info("websocket_connected", client_id=client_id)
     
     def disconnect(self, client_id: str):
@@ -29,8 +62,125 @@ class ConnectionManager:
             logger.info("websocket_disconnected", client_id=client_id)
     
     async def send_message(self, message: dict, client_id: str):
+        # Deliver directly when the client is connected to this worker
         if client_id in self.active_connections:
             await self.active_connections[client_id].send_json(message)
+            return
+        
+        try:
+            await get_redis().publish(_channel(client_id), json.dumps(message))
+        except RedisError as e:
+            logger.warning("websocket_publish_failed", client_id=client_id, error=str(e))
+    
+    async def send_stream(self, chunks: AsyncIterator[str], client_id: str):
+        """
+        Forward streamed text deltas to a client
+        
+        Deltas that arrive while the previous write is in flight are joined
+        into one "chunk" message, so a fast stream costs fewer writes. If the
+        stream raises, the error is logged and the client gets an "error"
+        message; the caller still sends "response_end" afterwards.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def _produce():
+            try:
+                async for chunk in chunks:
+                    queue.put_nowait(chunk)
+            finally:
+                queue.put_nowait(None)
+        
+        producer = asyncio.create_task(_produce())
+        try:
+            done = False
+            while not done:
+                parts = [await queue.get()]
+                while not queue.empty():
+                    parts.append(queue.get_nowait())
+                if parts[-1] is None:
+                    done = True
+                    parts.pop()
+                if parts:
+                    await self.send_message({
+                        "type": "chunk",
+                        "delta": "".join(parts)
+                    }, client_id)
+            
+            # The stream has ended; surface a failure instead of a silently short reply
+            try:
+                await producer
+            except Exception as e:
+                logger.error("websocket_stream_failed", client_id=client_id, error=str(e))
+                await self.send_message({
+                    "type": "error",
+                    "message": "The agent failed to finish its response. Please try again.",
+                    "timestamp": _now_iso()
+                }, client_id)
+        finally:
+            producer.cancel()
+    
+    async def _ensure_listener(self):
+        async with self._listener_lock:
+            if self._listener is not None and not self._listener.done():
+                return
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.psubscribe(_channel("*"))
+            except RedisError:
+                await pubsub.close()
+                raise
+            self._listener = asyncio.create_task(self._listen(pubsub))
+            self._listener.add_done_callback(self._on_listener_done)
+    
+    async def _listen(self, pubsub):
+        """Forward published messages to the clients connected to this worker"""
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                client_id = message["channel"].decode().split(":", 1)[1]
+                websocket = self.active_connections.get(client_id)
+                if websocket is None:
+                    continue
+                try:
+                    await websocket.send_text(message["data"].decode())
+                except Exception as e:
+                    logger.warning("websocket_forward_failed", client_id=client_id, error=str(e))
+                    self._close(client_id)
+        finally:
+            try:
+                await pubsub.close()
+            except RedisError:
+                pass
+    
+    def _on_listener_done(self, listener: asyncio.Task):
+        if listener.cancelled():
+            return
+        error = listener.exception()
+        logger.error(
+            "websocket_pubsub_failed",
+            error=str(error) if error else "subscription closed",
+            clients=len(self.active_connections)
+        )
+        # Without the subscription these sockets would silently stop getting
+        # updates; closing them makes clients reconnect and resubscribe
+        for client_id in list(self.active_connections):
+            self._close(client_id)
+    
+    def _close(self, client_id: str):
+        websocket = self.active_connections.pop(client_id, None)
+        if websocket is not None:
+            task = asyncio.create_task(self._close_quietly(websocket, client_id))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+    
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, client_id: str):
+        try:
+            await websocket.close(code=1011)
+        except Exception as e:
+            # Usually the client is already gone
+            logger.debug("websocket_close_failed", client_id=client_id, error=str(e))
 
 
 manager = ConnectionManager()
@@ -48,10 +198,15 @@ async def websocket_chat(websocket: WebSocket, client_id: str):
         "context": {...}
     }
     
-    Response format:
+    Response format (one or more "chunk" messages, an "error" message if the
+    agent fails mid-stream, then "response_end"):
+    {
+        "type": "chunk",
+        "delta": "partial agent response"
+    }
     {
-        "type": "response",
-        "message": "agent response",
+        "type": "response_end",
+        "typing": false,
         "timestamp": "ISO datetime"
     }
     """
@@ -59,46 +214,32 @@ async def websocket_chat(websocket: WebSocket, client_id: str):
     agent_platform = get_agent_platform()
     
     try:
-        while True:
-            # Receive message from client
-            data = await websocket.receive_json()
-            
+        # iter_json ends cleanly when the client disconnects
+        async for data in websocket.iter_json():
             message_type = data.get("type", "chat")
             user_message = data.get("message", "")
             context = data.get("context", {})
             
-            logger.info("websocket_message_received", 
-                       client_id=client_id, 
-                       message=user_message[:100])
-            
-            # Send typing indicator
-            await manager.send_message({
-                "type": "typing",
-                "status": True
-            }, client_id)
+            if LOG_INFO:
+                logger.info("websocket_message_received", 
+                           client_id=client_id, 
+                           message=user_message[:100])
             
-            # Process with agent
-            response = await agent_platform.chat(
-                message=user_message,
-                user_id=client_id
+            # Forward the agent's reply as it is generated
+            await manager.send_stream(
+                agent_platform.stream_chat(message=user_message, user_id=client_id),
+                client_id
             )
             
-            # Send response
-            await manager.send_message({
-                "type": "response",
-                "message": response,
-                "timestamp": json.dumps({"_": "now"})  # Simplified
-            }, client_id)
-            
-            # Stop typing indicator
+            # Mark the end of the response
             await manager.send_message({
-                "type": "typing",
-                "status": False
+                "type": "response_end",
+                "typing": False,
+                "timestamp": _now_iso()
             }, client_id)
-            
-    except WebSocketDisconnect:
-        manager.disconnect(client_id)
+        
         logger.info("client_disconnected", client_id=client_id)
     except Exception as e:
         logger.error("websocket_error", client_id=client_id, error=str(e))
+    finally:
         manager.disconnect(client_id)
@@ -2,31 +2,41 @@
 Application configuration and settings
 """
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+import logging
+from typing import List, Optional, Union
 from functools import lru_cache
 
 
+def _split_csv(value):
+    """Split a comma-separated env value into its stripped items"""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
 class Settings(BaseSettings):
     # Application
     APP_NAME: str = "Agentice"
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
-    LOG_LEVEL: str = "INFO"
+    # Defaults to WARNING in production and INFO elsewhere
+    LOG_LEVEL: Optional[str] = None
     SECRET_KEY: str
     
     # API
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     API_WORKERS: int = 4
-    CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
-    
-    @property
-    def cors_origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    # Union with str lets pydantic-settings pass CSV values through to the validator
+    CORS_ORIGINS: Union[List[str], str] = "http://localhost:3000,http://localhost:8000"
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
     REDIS_URL: str
     
     # LLM Providers
@@ -100,6 +110,7 @@ class Settings(BaseSettings):
     MAX_APPLICATIONS_PER_DAY: int = 50
     MAX_EMAILS_PER_HOUR: int = 100
     MAX_PROFILE_UPDATES_PER_WEEK: int = 10
+    MAX_CONCURRENT_APPLICATIONS: int = 5
     
     # AI Models
     DEFAULT_LLM_MODEL: str = "gpt-4-turbo-preview"
@@ -121,15 +132,23 @@ class Settings(BaseSettings):
     
     # Application Tracking
     TRACK_APPLICATION_STATUS: bool = True
-    APPLICATION_FOLLOWUP_DAYS: str = "7,14,21"
+    APPLICATION_FOLLOWUP_DAYS: Union[List[int], str] = "7,14,21"
+    
+    @field_validator("CORS_ORIGINS", "APPLICATION_FOLLOWUP_DAYS", mode="before")
+    @classmethod
+    def parse_csv(cls, value):
+        return _split_csv(value)
     
     @property
-    def followup_days_list(self) -> List[int]:
-        return [int(day.strip()) for day in self.APPLICATION_FOLLOWUP_DAYS.split(",")]
+    def log_level(self) -> int:
+        """Numeric level for the structlog filtering logger"""
+        name = self.LOG_LEVEL or ("WARNING" if self.ENVIRONMENT == "production" else "INFO")
+        return logging.getLevelName(name.upper())
     
     class Config:
         env_file = ".env"
         case_sensitive = True
+        validate_default = True
 
 
 @lru_cache()
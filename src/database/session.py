@@ -4,14 +4,20 @@ Database session management
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from src.config.settings import settings
 from src.models.database import Base
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+    # Statement echo is synchronous I/O, so keep it to development
+    echo=settings.DEBUG and settings.ENVIRONMENT == "development",
+    future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE
 )
 
 # Create async session factory
@@ -40,3 +46,14 @@ async def get_db():
             raise
         finally:
             await session.close()
+
+
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """Get database session as a FastAPI dependency"""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -5,32 +5,30 @@ Main FastAPI application entry point
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+import gzip
+import hashlib
+import importlib
+import orjson
 import structlog
 import logging
-import sys
 import os
 
 from src.config.settings import settings
-from src.api.routes import (
-    auth,
-    tasks,
-    events,
-    emails,
-    opportunities,
-    resumes,
-    applications,
-    profiles,
-    content,
-    notifications,
-    agents,
-    websocket,
-)
 from src.database.session import init_db
+from src.monitoring.log_sink import LogWriter, stdout_stream
 from src.monitoring.metrics import setup_metrics
 
+# Log lines are written by a background thread, off the event loop, into
+# stdout's buffer so a burst of records costs one write() call. The stream
+# is attached when the app starts; earlier lines wait in the queue.
+log_writer = LogWriter()
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -38,35 +36,77 @@ structlog.configure(
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(),
+        # orjson returns bytes, which the log writer emits without re-encoding
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    # Filtered levels are dropped by the bound logger before any processor runs
+    wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
     context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+    logger_factory=log_writer.logger_factory,
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
 
 
+# Route modules pull in the ORM, AutoGen and provider SDKs, so they are
+# imported when a worker starts serving rather than when src.main is imported
+ROUTERS = [
+    ("auth", "/api/v1/auth", "Authentication"),
+    ("websocket", "/api/v1", "WebSocket"),  # WebSocket for real-time chat
+    ("tasks", "/api/v1/tasks", "Tasks"),
+    ("events", "/api/v1/events", "Events"),
+    ("emails", "/api/v1/emails", "Emails"),
+    ("opportunities", "/api/v1/opportunities", "Opportunities"),
+    ("resumes", "/api/v1/resumes", "Resumes"),
+    ("applications", "/api/v1/applications", "Job Applications"),
+    ("profiles", "/api/v1/profiles", "Profiles"),
+    ("content", "/api/v1/content", "Content"),
+    ("notifications", "/api/v1/notifications", "Notifications"),
+    ("agents", "/api/v1/agents", "AI Agents"),
+]
+
+
+def _include_routers(app: FastAPI):
+    """Import the route modules and register their routers"""
+    for name, prefix, tag in ROUTERS:
+        module = importlib.import_module(f"src.api.routes.{name}")
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
+    log_writer.start(stdout_stream())
     logger.info("Starting Agentice Personal AI Assistant", environment=settings.ENVIRONMENT)
     
+    # Register API routes
+    _include_routers(app)
+    
     # Initialize database
     await init_db()
     
-    # Setup monitoring
-    setup_metrics(app)
+    # Load the dashboard assets into memory
+    _load_static_assets()
     
     logger.info("Agentice initialized successfully")
     
     yield
     
     logger.info("Shutting down Agentice")
+    from src.services.llm_service import llm_service
+    await llm_service.aclose()
+    log_writer.stop()
 
 
+CORS_ALLOW_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+CORS_ALLOW_HEADERS = ["Authorization", "Content-Type", "Accept", "Accept-Language", "X-Requested-With"]
+
+# Define frontend path (before creating app routes)
+# Resolved once at import; request handlers never touch the filesystem
+frontend_path = Path(__file__).resolve().parent.parent / "frontend"
+HAS_FRONTEND = frontend_path.is_dir()
+
 # Create FastAPI application
 app = FastAPI(
     title="Agentice - Personal AI Assistant",
@@ -84,57 +124,54 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let Starlette answer preflights from precomputed headers
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
 )
 
-# Define frontend path (before creating app routes)
-frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
+# Compress JSON responses; pre-gzipped assets already set Content-Encoding
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
-# Create FastAPI application
-app = FastAPI(
-    title="Agentice - Personal AI Assistant",
-    description="""
-    Jarvis-like AI assistant for task management, career development, and automated job applications.
+# Setup monitoring (/metrics and request timing) before the app starts
+setup_metrics(app)
+
+# Browsers may keep fingerprinted (?v=<hash>) assets forever; anything else
+# is revalidated against its ETag
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks versioned asset URLs as immutable"""
     
-    Features:
-    - Automated job search and application
-    - Resume & cover letter customization
-    - Task & email management
-    - Calendar integration
-    - Profile optimization (LinkedIn, GitHub, Portfolio)
-    - Content generation & curation
-    - Multi-agent system with AutoGen
-    """,
-    version="1.0.0",
-    lifespan=lifespan,
-)
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        versioned = b"v=" in scope.get("query_string", b"")
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL
+        return response
 
-# CORS Configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
 # Mount static files for frontend - MUST be before route definitions
-if os.path.exists(frontend_path):
-    app.mount("/static", StaticFiles(directory=frontend_path), name="static")
+if HAS_FRONTEND:
+    app.mount("/static", CachedStaticFiles(directory=frontend_path), name="static")
 
 # Exception handlers
-@app.exception_handler(Exception)
+# Registered for 500 so it runs from Starlette's outermost ServerErrorMiddleware
+# and only on the error path; HTTPException and validation errors keep
+# their default handlers
+@app.exception_handler(500)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error("Unhandled exception", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    # exc_info is rendered by format_exc_info only if the event is emitted
+    logger.error("Unhandled exception", path=request.url.path, exc_info=exc)
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "error": str(exc)},
     )
@@ -150,12 +187,80 @@ async def health_check():
     }
 
 
+# Dashboard assets served from memory, loaded once at startup
+# index.html comes last so its asset links can be fingerprinted
+_STATIC_FILES = {
+    "style.css": "text/css",
+    "app.js": "application/javascript",
+    "index.html": "text/html",
+}
+_STATIC_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def _load_static_assets():
+    """Read, gzip and fingerprint the dashboard assets"""
+    for name, media_type in _STATIC_FILES.items():
+        path = frontend_path / name
+        if not path.is_file():
+            continue
+        data = path.read_bytes()
+        if name == "index.html":
+            # Point the page at versioned asset URLs so they can be cached forever
+            for asset_name, asset in _STATIC_CACHE.items():
+                data = data.replace(
+                    f'"/{asset_name}"'.encode(),
+                    f'"/{asset_name}?v={asset["version"]}"'.encode()
+                )
+        version = hashlib.blake2b(data, digest_size=8).hexdigest()
+        _STATIC_CACHE[name] = {
+            "data": data,
+            "gzip": gzip.compress(data, 9),
+            "etag": f'"{version}"',
+            "version": version,
+            "media_type": media_type,
+            # Response headers for each (versioned, gzip) combination
+            "headers": {
+                (versioned, gzipped): _asset_headers(version, versioned, gzipped)
+                for versioned in (True, False)
+                for gzipped in (True, False)
+            },
+        }
+
+
+def _asset_headers(version: str, versioned: bool, gzipped: bool) -> Dict[str, str]:
+    headers = {
+        "ETag": f'"{version}"',
+        "Vary": "Accept-Encoding",
+        # Only a URL carrying the current version may be cached forever
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL,
+    }
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def _static_response(request: Request, name: str) -> Optional[Response]:
+    """Serve a cached asset, honouring If-None-Match and Accept-Encoding"""
+    asset = _STATIC_CACHE.get(name)
+    if asset is None:
+        return None
+    
+    versioned = request.query_params.get("v") == asset["version"]
+    if request.headers.get("if-none-match") == asset["etag"]:
+        return Response(status_code=304, headers=asset["headers"][versioned, False])
+    
+    # The whole body goes out in a single ASGI send from memory
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(asset["gzip"], media_type=asset["media_type"], headers=asset["headers"][versioned, True])
+    return Response(asset["data"], media_type=asset["media_type"], headers=asset["headers"][versioned, False])
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the frontend dashboard"""
-    frontend_file = os.path.join(frontend_path, "index.html")
-    if os.path.exists(frontend_file):
-        return FileResponse(frontend_file)
+    response = _static_response(request, "index.html")
+    if response is not None:
+        return response
     return {
         "message": "Welcome to Agentice - Your Personal AI Assistant",
         "documentation": "/docs",
@@ -165,18 +270,18 @@ async def root():
 
 # Serve static files (CSS, JS) from frontend directory
 @app.get("/style.css")
-async def serve_css():
-    css_file = os.path.join(frontend_path, "style.css")
-    if os.path.exists(css_file):
-        return FileResponse(css_file, media_type="text/css")
-    return JSONResponse({"error": "CSS file not found"}, status_code=404)
+async def serve_css(request: Request):
+    response = _static_response(request, "style.css")
+    if response is not None:
+        return response
+    return ORJSONResponse({"error": "CSS file not found"}, status_code=404)
 
 @app.get("/app.js")
-async def serve_js():
-    js_file = os.path.join(frontend_path, "app.js")
-    if os.path.exists(js_file):
-        return FileResponse(js_file, media_type="application/javascript")
-    return JSONResponse({"error": "JS file not found"}, status_code=404)
+async def serve_js(request: Request):
+    response = _static_response(request, "app.js")
+    if response is not None:
+        return response
+    return ORJSONResponse({"error": "JS file not found"}, status_code=404)
 
 @app.get("/api")
 async def api_root():
@@ -188,21 +293,6 @@ async def api_root():
     }
 
 
-# Include routers
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
-app.include_router(websocket.router, prefix="/api/v1", tags=["WebSocket"])  # WebSocket for real-time chat
-app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["Tasks"])
-app.include_router(events.router, prefix="/api/v1/events", tags=["Events"])
-app.include_router(emails.router, prefix="/api/v1/emails", tags=["Emails"])
-app.include_router(opportunities.router, prefix="/api/v1/opportunities", tags=["Opportunities"])
-app.include_router(resumes.router, prefix="/api/v1/resumes", tags=["Resumes"])
-app.include_router(applications.router, prefix="/api/v1/applications", tags=["Job Applications"])
-app.include_router(profiles.router, prefix="/api/v1/profiles", tags=["Profiles"])
-app.include_router(content.router, prefix="/api/v1/content", tags=["Content"])
-app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["Notifications"])
-app.include_router(agents.router, prefix="/api/v1/agents", tags=["AI Agents"])
-
-
 if __name__ == "__main__":
     import uvicorn
     
@@ -211,5 +301,11 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
-        workers=settings.API_WORKERS if not settings.DEBUG else 1,
+        workers=(settings.API_WORKERS or 2 * (os.cpu_count() or 1) + 1) if not settings.DEBUG else 1,
+        # uvloop and httptools ship with uvicorn[standard]
+        loop="uvloop",
+        http="httptools",
+        # Requests are logged through structlog
+        access_log=False,
+        log_config=None,
     )
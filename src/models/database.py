@@ -2,18 +2,112 @@
 Database models for Agentice
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, JSON, ForeignKey, Text, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, SmallInteger, Float, DateTime, Boolean, JSON, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 from datetime import datetime
 from enum import Enum
+from typing import Any, Dict, List
+import functools
+import json
+import os
+import time
 import uuid
 
 Base = declarative_base()
 
+# Binary JSONB on Postgres (parsed once on write, GIN-indexable); plain JSON elsewhere
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
 
 def generate_uuid():
-    return str(uuid.uuid4())
+    """
+    Generate a time-ordered UUIDv7 string
+    
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the right edge of the index instead of at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+class utcnow(FunctionElement):
+    """
+    SQL for the current UTC time as a naive timestamp
+    
+    Timestamp columns are naive and compared with datetime.utcnow(), so
+    database-side defaults must not depend on the session TimeZone. Only
+    rows written outside the ORM use it; the ORM sets the same columns from
+    datetime.utcnow, so their values are known after a flush and never have
+    to be loaded back.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is already UTC on SQLite
+    return "CURRENT_TIMESTAMP"
+
+
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+async def _bulk_insert(session, model, rows: List[Dict[str, Any]], **conflict) -> None:
+    """
+    Insert rows as multi-row INSERTs of up to BULK_INSERT_CHUNK_SIZE, skipping conflicts
+    
+    Rows may leave out columns to get their defaults. One INSERT names one
+    set of columns, so rows are grouped by the keys they set.
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    
+    for group in groups.values():
+        for start in range(0, len(group), BULK_INSERT_CHUNK_SIZE):
+            statement = pg_insert(model).values(group[start:start + BULK_INSERT_CHUNK_SIZE])
+            await session.execute(statement.on_conflict_do_nothing(**conflict))
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store an Enum as a SMALLINT code
+    
+    Codes follow member declaration order (starting at 1) and values load
+    back as enum members, so application code keeps using the enums. Only
+    append new members; reordering would remap stored rows.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = list(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members, 1)}
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value - 1]
 
 
 class User(Base):
@@ -27,7 +121,7 @@ class User(Base):
     locale = Column(String, default="en-US")
     
     # Preferences
-    preferences = Column(JSON, default=dict)
+    preferences = Column(JSONBType, default=dict)
     consents = Column(JSON, default=dict)
     
     # Feature flags
@@ -35,8 +129,8 @@ class User(Base):
     auto_profile_update_enabled = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
     integrations = relationship("Integration", back_populates="user", cascade="all, delete-orphan")
@@ -61,8 +155,8 @@ class Integration(Base):
     refresh_token_encrypted = Column(Text)
     expires_at = Column(DateTime)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="integrations")
 
@@ -77,6 +171,10 @@ class TaskStatus(str, Enum):
 class Task(Base):
     """Task management"""
     __tablename__ = "tasks"
+    # Per-user task lists filtered by status and sorted by due date
+    __table_args__ = (
+        Index("ix_tasks_user_status_due", "user_id", "status", "due_at"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -85,7 +183,7 @@ class Task(Base):
     title = Column(String, nullable=False)
     description = Column(Text)
     priority = Column(String)  # low, medium, high, urgent
-    status = Column(SQLEnum(TaskStatus), default=TaskStatus.TODO)
+    status = Column(SmallIntEnum(TaskStatus), default=TaskStatus.TODO)
     
     due_at = Column(DateTime)
     completed_at = Column(DateTime)
@@ -94,8 +192,8 @@ class Task(Base):
     labels = Column(JSON, default=list)
     confidence = Column(Float)  # AI confidence in task creation
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="tasks")
 
@@ -120,8 +218,8 @@ class Event(Base):
     attendees = Column(JSON, default=list)
     prep_notes = Column(Text)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="events")
 
@@ -129,6 +227,10 @@ class Event(Base):
 class Email(Base):
     """Email messages"""
     __tablename__ = "emails"
+    # Per-user inbox sorted by received time
+    __table_args__ = (
+        Index("ix_emails_user_received", "user_id", "received_at"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -140,16 +242,21 @@ class Email(Base):
     to_email = Column(String)
     subject = Column(String)
     snippet = Column(Text)
-    body = Column(Text)
+    body = deferred(Column(Text))  # Loaded on access; list views skip it
     
     received_at = Column(DateTime)
     triage_label = Column(String)  # action_required, fyi, archive, spam
-    action_json = Column(JSON)  # AI-suggested actions
+    action_json = Column(JSONBType)  # AI-suggested actions
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     
     user = relationship("User", back_populates="emails")
     tasks = relationship("Task", foreign_keys=[Task.created_from_email_id])
+    
+    @classmethod
+    async def bulk_upsert(cls, session, rows: List[Dict[str, Any]]) -> None:
+        """Insert synced emails in batches, skipping ones already stored"""
+        await _bulk_insert(session, cls, rows, index_elements=["provider_msg_id"])
 
 
 class OpportunityStatus(str, Enum):
@@ -164,6 +271,13 @@ class OpportunityStatus(str, Enum):
 class Opportunity(Base):
     """Job opportunities"""
     __tablename__ = "opportunities"
+    # Per-user opportunity lists filtered by status, newest first
+    __table_args__ = (
+        Index("ix_opportunities_user_status_discovered", "user_id", "status", "discovered_at"),
+        # Containment (@>) filters on tags and requirements
+        Index("ix_opportunities_tags_gin", "tags", postgresql_using="gin"),
+        Index("ix_opportunities_requirements_gin", "requirements", postgresql_using="gin"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -174,41 +288,63 @@ class Opportunity(Base):
     location = Column(String)
     url = Column(String, nullable=False)
     
-    description = Column(Text)
-    requirements = Column(JSON)  # Extracted requirements
-    salary_range = Column(JSON)
+    description = deferred(Column(Text))  # Loaded on access; list views skip it
+    requirements = Column(JSONBType)  # Extracted requirements
+    salary_range = Column(JSONBType)
     
-    tags = Column(JSON, default=list)
+    tags = Column(JSONBType, default=list)
     fit_score = Column(Float)  # 0.0 to 1.0
-    status = Column(SQLEnum(OpportunityStatus), default=OpportunityStatus.IDENTIFIED)
+    status = Column(SmallIntEnum(OpportunityStatus), default=OpportunityStatus.IDENTIFIED)
     
-    discovered_at = Column(DateTime, default=datetime.utcnow)
+    discovered_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     expires_at = Column(DateTime)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="opportunities")
     applications = relationship("Application", back_populates="opportunity")
+    
+    @classmethod
+    async def bulk_upsert(cls, session, rows: List[Dict[str, Any]]) -> None:
+        """Insert scraped opportunities in batches, skipping duplicate ids"""
+        await _bulk_insert(session, cls, rows)
 
 
 class Resume(Base):
     """Resume versions"""
     __tablename__ = "resumes"
+    # Lookup of a user's current resume
+    __table_args__ = (
+        Index("ix_resumes_user_current", "user_id", "is_current"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     
     title = Column(String, nullable=False)
     doc_url = Column(String)  # Path to file
-    content_json = Column(JSON)  # Structured resume data
+    content_json = deferred(Column(JSONBType))  # Structured resume data, loaded on access
     
     is_current = Column(Boolean, default=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="resumes")
+    
+    @functools.cached_property
+    def text(self) -> str:
+        """Plain-text rendering of the resume for LLM prompts, built once per instance"""
+        lines = [self.title]
+        for section, value in (self.content_json or {}).items():
+            if not isinstance(value, str):
+                value = json.dumps(value, default=str)
+            lines.append(f"{section.replace('_', ' ').title()}: {value}")
+        return "\n".join(lines)
+    
+    def to_text(self) -> str:
+        return self.text
 
 
 class ApplicationStatus(str, Enum):
@@ -228,15 +364,21 @@ class ApplicationStatus(str, Enum):
 class Application(Base):
     """Job applications"""
     __tablename__ = "applications"
+    # Per-user application lists and stats, with and without a status filter
+    __table_args__ = (
+        Index("ix_applications_user_status_created", "user_id", "status", "created_at"),
+        # id breaks created_at ties for keyset pagination
+        Index("ix_applications_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     opportunity_id = Column(String, ForeignKey("opportunities.id"), nullable=False)
     
-    resume_variant = Column(JSON)  # Customized resume
-    cover_letter = Column(Text)
+    resume_variant = Column(JSONBType)  # Customized resume
+    cover_letter = deferred(Column(Text))  # Loaded on access; list views skip it
     
-    status = Column(SQLEnum(ApplicationStatus), default=ApplicationStatus.DRAFT)
+    status = Column(SmallIntEnum(ApplicationStatus), default=ApplicationStatus.DRAFT)
     confirmation_number = Column(String)
     
     submitted_at = Column(DateTime)
@@ -244,13 +386,46 @@ class Application(Base):
     
     notes = Column(Text)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User", back_populates="applications")
     opportunity = relationship("Opportunity", back_populates="applications")
 
 
+class GeneratedArtifact(Base):
+    """LLM-generated application materials, reused for identical inputs"""
+    __tablename__ = "generated_artifacts"
+    # One artifact per (user, job, inputs, type); also serves the cache lookup
+    __table_args__ = (
+        Index(
+            "ux_generated_artifacts_lookup",
+            "user_id", "job_hash", "input_snapshot_hash", "type",
+            unique=True
+        ),
+    )
+    
+    id = Column(String, primary_key=True, default=generate_uuid)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    
+    job_hash = Column(String(64), nullable=False)  # sha256 of the job description
+    type = Column(String, nullable=False)  # resume_variant, cover_letter
+    content = Column(JSONBType)
+    input_snapshot_hash = Column(String(64), nullable=False)  # Base resume version + template version
+    
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    
+    user = relationship("User")
+    
+    @classmethod
+    async def bulk_upsert(cls, session, rows: List[Dict[str, Any]]) -> None:
+        """Store generated artifacts, keeping the first one written for a key"""
+        await _bulk_insert(
+            session, cls, rows,
+            index_elements=["user_id", "job_hash", "input_snapshot_hash", "type"]
+        )
+
+
 class ChangesetStatus(str, Enum):
     DRAFT = "draft"
     PENDING = "pending"
@@ -262,6 +437,10 @@ class ChangesetStatus(str, Enum):
 class Changeset(Base):
     """Proposed changes requiring approval"""
     __tablename__ = "changesets"
+    # Pending changesets awaiting a user's review
+    __table_args__ = (
+        Index("ix_changesets_user_status", "user_id", "status"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -272,12 +451,12 @@ class Changeset(Base):
     changes = Column(JSON)  # Structured diff
     rationale = Column(Text)
     
-    status = Column(SQLEnum(ChangesetStatus), default=ChangesetStatus.DRAFT)
+    status = Column(SmallIntEnum(ChangesetStatus), default=ChangesetStatus.DRAFT)
     
     reviewed_at = Column(DateTime)
     applied_at = Column(DateTime)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     
     user = relationship("User", back_populates="changesets")
 
@@ -298,8 +477,8 @@ class ContentDraft(Base):
     
     published_at = Column(DateTime)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     user = relationship("User")
 
@@ -317,6 +496,6 @@ class Feedback(Base):
     
     feedback_metadata = Column(JSON, default=dict)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     
     user = relationship("User")
@@ -0,0 +1,126 @@
+"""
+Background log sink so request handlers never block on stdout
+"""
+
+import queue
+import sys
+import threading
+import time
+from typing import BinaryIO, Iterable, Optional
+
+_STOP = None
+_FLUSH = b""
+
+
+class QueueLogger:
+    """structlog logger that hands rendered lines to the writer thread"""
+
+    def __init__(self, lines: queue.SimpleQueue):
+        self._lines = lines
+
+    def msg(self, message: bytes):
+        self._lines.put(message + b"\n")
+
+    def urgent(self, message: bytes):
+        # Errors are flushed right away so they survive a crash
+        self._lines.put(message + b"\n")
+        self._lines.put(_FLUSH)
+
+    log = debug = info = warn = warning = msg
+    err = error = critical = exception = fatal = failure = urgent
+
+
+class _TextStream:
+    """Binary writes onto a text-only stream, such as a replaced sys.stdout"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def writelines(self, lines: Iterable[bytes]):
+        self._stream.write(b"".join(lines).decode("utf-8", "replace"))
+
+    def flush(self):
+        self._stream.flush()
+
+
+def stdout_stream() -> BinaryIO:
+    """
+    Binary stream over the current sys.stdout
+
+    Uses sys.stdout.buffer, the same buffer print() and stdlib logging
+    write through, so lines from every writer stay whole. Streams without
+    a buffer (pytest capture, StringIO) get their text write() instead.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    return buffer if buffer is not None else _TextStream(sys.stdout)
+
+
+class LogWriter:
+    """
+    Writes queued log lines from a dedicated thread
+
+    Every line waiting in the queue is written with a single writelines()
+    call into a buffered stream, which is flushed every flush_interval
+    seconds or as soon as an error is logged.
+
+    Lines logged before start() wait in the queue, so the writer can be
+    created (and handed to structlog) before its stream exists.
+    """
+
+    def __init__(self, stream: Optional[BinaryIO] = None, flush_interval: float = 1.0):
+        self._stream = stream
+        self.flush_interval = flush_interval
+        self._lines: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def logger_factory(self, *args) -> QueueLogger:
+        """structlog logger factory"""
+        return QueueLogger(self._lines)
+
+    def start(self, stream: Optional[BinaryIO] = None):
+        if stream is not None:
+            self._stream = stream
+        if self._stream is None:
+            self._stream = stdout_stream()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._lines.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        # Anything logged after the thread stopped is written inline
+        if self._stream is not None:
+            self._write(self._drain([]))
+
+    def _run(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                batch = self._drain([self._lines.get(timeout=self.flush_interval)])
+            except queue.Empty:
+                batch = []
+
+            now = time.monotonic()
+            flush = _FLUSH in batch or _STOP in batch or now - last_flush >= self.flush_interval
+            self._write(batch, flush=flush)
+            if flush:
+                last_flush = now
+            if _STOP in batch:
+                return
+
+    def _drain(self, batch: list) -> list:
+        while True:
+            try:
+                batch.append(self._lines.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _write(self, batch: list, flush: bool = True):
+        lines = [line for line in batch if line]
+        if lines:
+            self._stream.writelines(lines)
+        if flush:
+            self._stream.flush()
@@ -2,19 +2,62 @@
 Monitoring and metrics setup
 """
 
-from prometheus_client import Counter, Histogram, Gauge
+import time
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, Gauge, ProcessCollector, make_asgi_app
 from fastapi import FastAPI
 
 
+# Dedicated registry; auto_describe=False skips describe() scans on registration
+registry = CollectorRegistry(auto_describe=False)
+ProcessCollector(registry=registry)
+
 # Define metrics
-applications_submitted = Counter('applications_submitted_total', 'Total applications submitted')
-applications_approved = Counter('applications_approved_total', 'Total applications approved')
-job_search_duration = Histogram('job_search_duration_seconds', 'Time spent searching for jobs')
-active_users = Gauge('active_users', 'Number of active users')
+applications_submitted = Counter('applications_submitted_total', 'Total applications submitted', registry=registry)
+applications_approved = Counter('applications_approved_total', 'Total applications approved', registry=registry)
+job_search_duration = Histogram('job_search_duration_seconds', 'Time spent searching for jobs', registry=registry)
+active_users = Gauge('active_users', 'Number of active users', registry=registry)
+request_duration = Histogram(
+    'http_request_duration_seconds',
+    'Time spent handling API requests',
+    ['path'],
+    registry=registry
+)
+llm_cache_lookups = Counter(
+    'llm_cache_lookups_total',
+    'LLM completion cache lookups',
+    ['tier', 'result'],
+    registry=registry
+)
+
+# Only the LLM-backed endpoints are timed
+TIMED_PATH_PREFIXES = ("/api/v1/applications", "/api/v1/agents")
+
+
+class RequestTimingMiddleware:
+    """ASGI middleware recording request durations for TIMED_PATH_PREFIXES"""
+    
+    def __init__(self, app, prefixes=TIMED_PATH_PREFIXES):
+        self.app = app
+        self.prefixes = prefixes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # Label by route template, not raw path, to bound label cardinality
+            route = scope.get("route")
+            path = getattr(route, "path", None) or next(p for p in self.prefixes if scope["path"].startswith(p))
+            request_duration.labels(path).observe(time.perf_counter() - start)
 
 
 def setup_metrics(app: FastAPI):
     """Setup Prometheus metrics for the application"""
     
-    # Metrics are automatically collected by prometheus_client
-    pass
+    app.add_middleware(RequestTimingMiddleware)
+    app.mount("/metrics", make_asgi_app(registry=registry))
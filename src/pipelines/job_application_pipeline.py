@@ -3,21 +3,74 @@ Job Application Automation Pipeline
 End-to-end workflow for autonomous job applications
 """
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta
 import structlog
 import asyncio
+import httpx
+import hashlib
+import orjson
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload, undefer
 
 from src.agents.simple_agents import AgentManager
-from src.models.database import Opportunity, OpportunityStatus, Application, ApplicationStatus, Resume
+from src.models.database import Opportunity, OpportunityStatus, Application, ApplicationStatus, Resume, generate_uuid
 from src.services.job_scraper_service import JobScraperService
 from src.services.resume_service import ResumeService
 from src.services.application_service import ApplicationService
 from src.services.notification_service import NotificationService
+from src.services.artifact_service import (
+    ArtifactService,
+    COVER_LETTER,
+    RESUME_VARIANT,
+    job_hash,
+    snapshot_hash,
+)
+from src.services.llm_service import llm_service
 from src.database.session import get_db
+from src.config.settings import settings
 
 logger = structlog.get_logger()
 
+# Opportunities scored per LLM call; the resume is sent once per batch
+FIT_SCORE_BATCH_SIZE = 10
+
+# Share of opportunities (by resume keyword overlap) that get an LLM fit score
+PREFILTER_KEEP_RATIO = 0.5
+PREFILTER_MIN_KEEP = 10
+
+# Keeps skills like c++, c# and node.js as single tokens
+_WORD_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9]+)*")
+
+# Columns written when scraped opportunities are bulk-inserted
+OPPORTUNITY_FIELDS = (
+    "id", "user_id", "source", "title", "company", "location", "url",
+    "description", "fit_score", "status", "discovered_at",
+)
+
+# Applications listed in the daily summary email before it says "and N more"
+SUMMARY_MAX_ITEMS = 50
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "ref", "refid", "trk", "trackingid"}
+
+
+def _normalize_url(url: Optional[str]) -> str:
+    """Canonical form of a job URL, without tracking parameters or fragment"""
+    parts = urlsplit((url or "").strip())
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def _tokens(text: Optional[str]) -> set:
+    """Lower-cased word set for keyword overlap"""
+    return set(_WORD_RE.findall((text or "").lower()))
+
 
 class JobApplicationPipeline:
     """
@@ -30,13 +83,46 @@ class JobApplicationPipeline:
     6. Track status and follow-ups
     """
     
-    def __init__(self, user_id: str):
+    # Static instructions and the resume lead the prompt, so every batch in a
+    # run shares a byte-identical prefix the provider's prompt cache can reuse
+    _FIT_PROMPT_HEAD = (
+        "Analyze how well each job opportunity below matches the candidate's profile.\n"
+        "\n"
+        "Consider:\n"
+        "- Skills match (required vs. candidate's skills)\n"
+        "- Experience level match\n"
+        "- Domain expertise\n"
+        "- Education requirements\n"
+        "- Location/remote preference\n"
+        "\n"
+        "Provide a fit score between 0.0 and 1.0 for each job, where:\n"
+        "- 1.0 = Perfect match\n"
+        "- 0.8-0.9 = Excellent match\n"
+        "- 0.6-0.7 = Good match\n"
+        "- 0.4-0.5 = Moderate match\n"
+        "- Below 0.4 = Poor match\n"
+        "\n"
+        "CANDIDATE RESUME:\n"
+        "{resume}\n"
+        "\n"
+        "JOB OPPORTUNITIES:\n"
+        "\n"
+    )
+    
+    def __init__(self, user_id: str, http_client: Optional[httpx.AsyncClient] = None):
         self.user_id = user_id
         self.agent_system = AgentManager.get_agent_system(user_id)
-        self.job_scraper = JobScraperService()
+        # The scraper's pooled client lives at least as long as the pipeline, so
+        # repeated requests to a job board reuse open TLS connections; workers
+        # pass one client that outlives every pipeline they run
+        self.job_scraper = JobScraperService(http_client)
         self.resume_service = ResumeService()
         self.application_service = ApplicationService()
         self.notification_service = NotificationService()
+        self.artifact_service = ArtifactService()
+        self.max_concurrent_applications = settings.MAX_CONCURRENT_APPLICATIONS
+        self._fit_prefix: Optional[str] = None
+        self._fit_prefix_for: Optional[Resume] = None
     
     async def run_daily_job_search(
         self,
@@ -61,36 +147,74 @@ class JobApplicationPipeline:
             opportunities = await self._search_opportunities(criteria)
             logger.info(f"Found {len(opportunities)} opportunities")
             
-            # 3. Score and rank opportunities
-            ranked_opportunities = await self._rank_opportunities(opportunities)
+            # 3. Score and rank opportunities; the base resume is fetched once for the whole run
+            base_resume = await self.resume_service.get_current_resume(self.user_id)
+            ranked_opportunities = await self._rank_opportunities(opportunities, base_resume)
             
-            # 4. Filter to top N opportunities
+            # 4. Filter to top N opportunities and store them in one insert
             top_opportunities = ranked_opportunities[:criteria.get('max_applications_per_day', 10)]
+            await self._save_opportunities(top_opportunities)
+            
+            # 5. Process opportunities concurrently; each one is dominated by LLM and HTTP waits
+            sem = asyncio.Semaphore(self.max_concurrent_applications)
             
-            # 5. Process each opportunity
-            applications = []
-            for opportunity in top_opportunities:
-                try:
-                    application = await self._process_opportunity(opportunity)
-                    if application:
-                        applications.append(application)
-                except Exception as e:
-                    logger.error(f"Error processing opportunity", opportunity_id=opportunity.id, error=str(e))
-                    continue
+            async def _guarded(opportunity: Opportunity, step) -> Optional[Application]:
+                async with sem:
+                    try:
+                        return await step
+                    except Exception as e:
+                        logger.error(f"Error processing opportunity", opportunity_id=opportunity.id, error=str(e))
+                        return None
+            
+            # Drafts are generated concurrently, then saved together in one commit
+            drafts = await asyncio.gather(*[
+                _guarded(o, self._prepare_application(o, base_resume)) for o in top_opportunities
+            ])
+            prepared = [(o, draft) for o, draft in zip(top_opportunities, drafts) if draft is not None]
+            await self._save_applications([draft for _, draft in prepared])
+            
+            results = await asyncio.gather(*[
+                _guarded(o, self._finalize_application(draft, o)) for o, draft in prepared
+            ])
+            submitted = [
+                (opportunity, result)
+                for (opportunity, _), result in zip(prepared, results)
+                if isinstance(result, Application) and result.status == ApplicationStatus.SUBMITTED
+            ]
+            pending_approval = sum(
+                1 for result in results
+                if isinstance(result, Application) and result.status == ApplicationStatus.PENDING_APPROVAL
+            )
             
             # 6. Send summary to user
-            await self._send_daily_summary(applications)
+            await self._send_daily_summary(submitted)
             
             return {
                 "opportunities_found": len(opportunities),
-                "applications_submitted": len(applications),
-                "applications": [app.dict() for app in applications],
+                "applications_submitted": len(submitted),
+                "applications_pending_approval": pending_approval,
+                # Summaries only; full resume variants and cover letters stay in the database
+                "applications": [
+                    {
+                        "id": application.id,
+                        "company": opportunity.company,
+                        "title": opportunity.title,
+                        "status": application.status
+                    }
+                    for opportunity, application in submitted
+                ],
                 "timestamp": datetime.utcnow().isoformat()
             }
             
         except Exception as e:
             logger.error("Error in daily job search", error=str(e))
             raise
+        finally:
+            await self.aclose()
+    
+    async def aclose(self):
+        """Close the pipeline's pooled HTTP client"""
+        await self.job_scraper.aclose()
     
     async def apply_to_specific_job(
         self,
@@ -126,11 +250,9 @@ class JobApplicationPipeline:
             status=OpportunityStatus.IDENTIFIED
         )
         
-        # Save opportunity
+        # Save opportunity; ids and timestamps are set in Python, so no refresh is needed
         async with get_db() as db:
             db.add(opportunity)
-            await db.commit()
-            await db.refresh(opportunity)
         
         # Process the opportunity
         application = await self._process_opportunity(opportunity, auto_submit=auto_submit)
@@ -140,39 +262,53 @@ class JobApplicationPipeline:
     async def _search_opportunities(self, criteria: Dict[str, Any]) -> List[Opportunity]:
         """Search for job opportunities across multiple platforms"""
         
-        all_opportunities = []
-        
-        # Search Indeed
-        if criteria.get('search_indeed', True):
-            indeed_jobs = await self.job_scraper.search_indeed(
-                query=criteria.get('keywords', ''),
-                location=criteria.get('location', ''),
-                remote=criteria.get('remote_only', False)
-            )
-            all_opportunities.extend(indeed_jobs)
-        
-        # Search LinkedIn
-        if criteria.get('search_linkedin', True):
-            linkedin_jobs = await self.job_scraper.search_linkedin(
-                query=criteria.get('keywords', ''),
-                location=criteria.get('location', '')
-            )
-            all_opportunities.extend(linkedin_jobs)
-        
-        # Search Glassdoor
-        if criteria.get('search_glassdoor', False):
-            glassdoor_jobs = await self.job_scraper.search_glassdoor(
-                query=criteria.get('keywords', ''),
-                location=criteria.get('location', '')
+        sources = [
+            source
+            for source, enabled in (
+                ('indeed', criteria.get('search_indeed', True)),
+                ('linkedin', criteria.get('search_linkedin', True)),
+                ('glassdoor', criteria.get('search_glassdoor', False)),
             )
-            all_opportunities.extend(glassdoor_jobs)
+            if enabled
+        ]
+        
+        # Boards are searched concurrently; one failing board doesn't drop the others
+        all_opportunities = await self.job_scraper.search_all(
+            query=criteria.get('keywords', ''),
+            location=criteria.get('location', ''),
+            remote=criteria.get('remote_only', False),
+            sources=sources
+        )
         
         # Remove duplicates
         unique_opportunities = self._deduplicate_opportunities(all_opportunities)
         
         return unique_opportunities
     
-    async def _rank_opportunities(self, opportunities: List[Opportunity]) -> List[Opportunity]:
+    async def _save_opportunities(self, opportunities: List[Opportunity]):
+        """Store scraped opportunities with one multi-row INSERT"""
+        
+        for opportunity in opportunities:
+            opportunity.id = opportunity.id or generate_uuid()
+            opportunity.user_id = self.user_id
+        
+        # Unset fields are left out rather than sent as NULL, so the column
+        # defaults (status, discovered_at) still apply
+        async with get_db() as db:
+            await Opportunity.bulk_upsert(db, [
+                {
+                    field: getattr(opportunity, field)
+                    for field in OPPORTUNITY_FIELDS
+                    if getattr(opportunity, field) is not None
+                }
+                for opportunity in opportunities
+            ])
+    
+    async def _rank_opportunities(
+        self,
+        opportunities: List[Opportunity],
+        user_resume: Resume
+    ) -> List[Opportunity]:
         """
         Rank opportunities based on fit score
         
@@ -185,23 +321,39 @@ class JobApplicationPipeline:
         - Growth potential
         """
         
-        # Get user profile and resume
-        user_resume = await self.resume_service.get_current_resume(self.user_id)
+        # Cheap keyword overlap first, so only the better half reaches the LLM
+        resume_tokens = _tokens(user_resume.to_text())
         
-        # Score each opportunity
-        for opportunity in opportunities:
-            score = await self._calculate_fit_score(opportunity, user_resume)
-            opportunity.fit_score = score
+        def overlap(opportunity: Opportunity) -> float:
+            job_tokens = _tokens(opportunity.description)
+            return len(resume_tokens & job_tokens) / max(len(job_tokens), 1)
+        
+        prefiltered = sorted(opportunities, key=overlap, reverse=True)
+        keep = max(int(len(prefiltered) * PREFILTER_KEEP_RATIO), PREFILTER_MIN_KEEP)
+        candidates, dropped = prefiltered[:keep], prefiltered[keep:]
+        
+        # Score opportunities in batches, one LLM call per batch, all batches at once
+        batches = [
+            candidates[i:i + FIT_SCORE_BATCH_SIZE]
+            for i in range(0, len(candidates), FIT_SCORE_BATCH_SIZE)
+        ]
+        batch_scores = await asyncio.gather(
+            *[self._calculate_fit_scores(batch, user_resume) for batch in batches]
+        )
+        for batch, scores in zip(batches, batch_scores):
+            for opportunity, score in zip(batch, scores):
+                opportunity.fit_score = score
         
-        # Sort by fit score
-        ranked = sorted(opportunities, key=lambda x: x.fit_score or 0, reverse=True)
+        # Sort by fit score; prefiltered-out opportunities follow in overlap order
+        ranked = sorted(candidates, key=lambda x: x.fit_score or 0, reverse=True)
         
-        return ranked
+        return ranked + dropped
     
     async def _process_opportunity(
         self,
         opportunity: Opportunity,
-        auto_submit: bool = False
+        auto_submit: bool = False,
+        base_resume: Optional[Resume] = None
     ) -> Optional[Application]:
         """
         Process a single opportunity: customize materials, get approval, submit
@@ -209,154 +361,221 @@ class JobApplicationPipeline:
         Args:
             opportunity: Opportunity to apply to
             auto_submit: Skip approval if enabled
+            base_resume: User's current resume, when the caller already has it
             
         Returns:
-            Application record if submitted, None otherwise
+            Application record if submitted or awaiting approval, None otherwise
         """
         logger.info("Processing opportunity", opportunity_id=opportunity.id, company=opportunity.company)
         
         try:
             # 1. Get user's base resume
-            base_resume = await self.resume_service.get_current_resume(self.user_id)
+            if base_resume is None:
+                base_resume = await self.resume_service.get_current_resume(self.user_id)
             
-            # 2. Customize resume for this job
-            logger.info("Customizing resume")
-            customized_resume = await self.agent_system.optimize_resume_for_job(
+            application = await self._prepare_application(opportunity, base_resume)
+            await self._save_applications([application])
+            
+            return await self._finalize_application(application, opportunity, auto_submit=auto_submit)
+                
+        except Exception as e:
+            logger.error("Error processing opportunity", error=str(e))
+            return None
+    
+    async def _prepare_application(self, opportunity: Opportunity, base_resume: Resume) -> Application:
+        """Build an unsaved draft application with tailored materials"""
+        
+        # 2-3. Customize resume and generate cover letter, reusing materials
+        # already generated for the same posting and resume version. Postings
+        # without a description can't be told apart, so they are never cached.
+        artifact_key = None
+        if opportunity.description and opportunity.description.strip():
+            artifact_key = (
+                self.user_id,
+                job_hash(opportunity.company, opportunity.title, opportunity.description),
+                snapshot_hash(self.user_id, base_resume)
+            )
+        artifacts = await self.artifact_service.get_artifacts(*artifact_key) if artifact_key else {}
+        
+        generators = {}
+        if RESUME_VARIANT not in artifacts:
+            generators[RESUME_VARIANT] = self.agent_system.optimize_resume_for_job(
                 job_description=opportunity.description,
                 current_resume=base_resume
             )
-            
-            # 3. Generate cover letter
-            logger.info("Generating cover letter")
-            cover_letter = await self.agent_system.generate_cover_letter(
+        if COVER_LETTER not in artifacts:
+            generators[COVER_LETTER] = self.agent_system.generate_cover_letter(
                 job_description=opportunity.description,
                 company_name=opportunity.company,
                 resume=base_resume
             )
-            
-            # 4. Create application record
-            application = Application(
-                user_id=self.user_id,
-                opportunity_id=opportunity.id,
-                resume_variant=customized_resume,
-                cover_letter=cover_letter,
-                status=ApplicationStatus.DRAFT,
-                created_at=datetime.utcnow()
+        
+        if generators:
+            # Both calls only read the base resume and job description, so they run together
+            logger.info("Generating application materials", artifacts=list(generators))
+            generated = dict(zip(generators, await asyncio.gather(*generators.values())))
+            if artifact_key:
+                await self.artifact_service.save_artifacts(*artifact_key, generated)
+            artifacts.update(generated)
+        
+        customized_resume = artifacts[RESUME_VARIANT]
+        cover_letter = artifacts[COVER_LETTER]
+        
+        # 4. Create application record
+        application = Application(
+            user_id=self.user_id,
+            opportunity_id=opportunity.id,
+            resume_variant=customized_resume,
+            cover_letter=cover_letter,
+            status=ApplicationStatus.DRAFT,
+            created_at=datetime.utcnow()
+        )
+        
+        return application
+    
+    async def _save_applications(self, applications: List[Application]):
+        """Persist draft applications in a single transaction"""
+        
+        if not applications:
+            return
+        
+        # One commit for the whole batch; ids and timestamps are set in Python, so nothing is loaded back
+        async with get_db() as db:
+            db.add_all(applications)
+    
+    async def _finalize_application(
+        self,
+        application: Application,
+        opportunity: Opportunity,
+        auto_submit: bool = False
+    ) -> Optional[Application]:
+        """
+        Submit a saved draft, or leave it awaiting the user's approval
+        
+        Approval can take a day, so nothing waits for it here: the approve
+        endpoint queues submit_approved_application once the user decides.
+        """
+        
+        # 5. Request approval (unless auto_submit is enabled)
+        if not auto_submit:
+            await self._request_approval(application, opportunity)
+            return application
+        
+        # 6. Submit application
+        return await self._submit_and_record(application, opportunity)
+    
+    async def submit_approved_application(self, application_id: str) -> Optional[Application]:
+        """
+        Submit one of the user's applications after it has been approved
+        
+        Returns:
+            Application record if submitted, None otherwise
+        """
+        
+        async with get_db() as db:
+            result = await db.execute(
+                select(Application).options(
+                    selectinload(Application.opportunity),
+                    undefer(Application.cover_letter)
+                ).where(
+                    Application.id == application_id,
+                    Application.user_id == self.user_id
+                )
             )
+            application = result.scalars().first()
+        
+        if application is None or application.status != ApplicationStatus.APPROVED:
+            logger.warning("Application not ready to submit", application_id=application_id)
+            return None
+        
+        return await self._submit_and_record(application, application.opportunity)
+    
+    async def _submit_and_record(self, application: Application, opportunity: Opportunity) -> Optional[Application]:
+        """Submit an application and store the outcome"""
+        
+        logger.info("Submitting application", application_id=application.id)
+        submission_result = await self._submit_application(application, opportunity)
+        
+        if submission_result['success']:
+            application.status = ApplicationStatus.SUBMITTED
+            application.submitted_at = datetime.utcnow()
+            application.confirmation_number = submission_result.get('confirmation_number')
             
-            # Save draft application
-            async with get_db() as db:
-                db.add(application)
-                await db.commit()
-                await db.refresh(application)
+            # Update opportunity status
+            opportunity.status = OpportunityStatus.APPLIED
             
-            # 5. Request approval (unless auto_submit is enabled)
-            if not auto_submit:
-                approved = await self._request_approval(application)
-                if not approved:
-                    logger.info("Application not approved", application_id=application.id)
-                    application.status = ApplicationStatus.REJECTED
-                    await self.application_service.update_application(application)
-                    return None
+            await self.application_service.update_application(application)
             
-            # 6. Submit application
-            logger.info("Submitting application", application_id=application.id)
-            submission_result = await self._submit_application(application, opportunity)
+            # Schedule follow-up reminders
+            await self._schedule_followups(application, opportunity)
             
-            if submission_result['success']:
-                application.status = ApplicationStatus.SUBMITTED
-                application.submitted_at = datetime.utcnow()
-                application.confirmation_number = submission_result.get('confirmation_number')
-                
-                # Update opportunity status
-                opportunity.status = OpportunityStatus.APPLIED
-                
-                await self.application_service.update_application(application)
-                
-                # Schedule follow-up reminders
-                await self._schedule_followups(application)
-                
-                logger.info("Application submitted successfully", application_id=application.id)
-                return application
-            else:
-                logger.error("Application submission failed", error=submission_result.get('error'))
-                application.status = ApplicationStatus.FAILED
-                await self.application_service.update_application(application)
-                return None
-                
-        except Exception as e:
-            logger.error("Error processing opportunity", error=str(e))
+            logger.info("Application submitted successfully", application_id=application.id)
+            return application
+        else:
+            logger.error("Application submission failed", error=submission_result.get('error'))
+            application.status = ApplicationStatus.FAILED
+            await self.application_service.update_application(application)
             return None
     
-    async def _calculate_fit_score(
+    def _fit_prompt_prefix(self, resume: Resume) -> str:
+        """Fit-score instructions plus resume, formatted once per resume"""
+        
+        if self._fit_prefix_for is not resume:
+            self._fit_prefix = self._FIT_PROMPT_HEAD.format(resume=resume.to_text())
+            self._fit_prefix_for = resume
+        return self._fit_prefix
+    
+    async def _calculate_fit_scores(
         self,
-        opportunity: Opportunity,
+        opportunities: List[Opportunity],
         resume: Resume
-    ) -> float:
+    ) -> List[Optional[float]]:
         """
-        Calculate how well the opportunity matches the user's profile
+        Calculate how well each opportunity matches the user's profile
         
         Returns:
-            Float between 0.0 and 1.0
+            One float between 0.0 and 1.0 per opportunity, or None where
+            the LLM response could not be used
         """
         
-        # Use LLM to calculate fit score
-        prompt = f"""
-        Analyze how well this job opportunity matches the candidate's profile.
-        
-        JOB OPPORTUNITY:
-        Title: {opportunity.title}
-        Company: {opportunity.company}
-        Description: {opportunity.description}
-        
-        CANDIDATE RESUME:
-        {resume.to_text()}
-        
-        Consider:
-        - Skills match (required vs. candidate's skills)
-        - Experience level match
-        - Domain expertise
-        - Education requirements
-        - Location/remote preference
-        
-        Provide a fit score between 0.0 and 1.0, where:
-        - 1.0 = Perfect match
-        - 0.8-0.9 = Excellent match
-        - 0.6-0.7 = Good match
-        - 0.4-0.5 = Moderate match
-        - Below 0.4 = Poor match
-        
-        Return only the numeric score.
-        """
+        jobs = "\n\n".join(
+            f"JOB {index}:\n"
+            f"Title: {opportunity.title}\n"
+            f"Company: {opportunity.company}\n"
+            f"Description: {(opportunity.description or '')[:2000]}"
+            for index, opportunity in enumerate(opportunities, 1)
+        )
         
-        # Get score from LLM
-        # Implementation here
-        score = 0.75  # Placeholder
+        # Use LLM to calculate all fit scores in one call; only the jobs and
+        # count follow the shared prefix
+        prompt = (
+            self._fit_prompt_prefix(resume)
+            + jobs
+            + f"\n\nReturn only a JSON array of {len(opportunities)} numeric scores, in job order."
+        )
         
-        return score
+        try:
+            response = await llm_service.generate_completion(prompt)
+            scores = orjson.loads(response[response.index("["):response.rindex("]") + 1])
+            if len(scores) != len(opportunities):
+                raise ValueError(f"expected {len(opportunities)} scores, got {len(scores)}")
+            return [min(max(float(score), 0.0), 1.0) for score in scores]
+        except Exception as e:
+            logger.error("Fit scoring failed", opportunities=len(opportunities), error=str(e))
+            return [None] * len(opportunities)
     
-    async def _request_approval(self, application: Application) -> bool:
-        """
-        Request user approval for application submission
+    async def _request_approval(self, application: Application, opportunity: Opportunity):
+        """Mark the application as awaiting approval and ask the user to review it"""
         
-        Returns:
-            True if approved, False otherwise
-        """
+        application.status = ApplicationStatus.PENDING_APPROVAL
+        await self.application_service.update_application(application)
         
         # Send notification to user with application details
         await self.notification_service.send_approval_request(
             user_id=self.user_id,
             application_id=application.id,
-            message=f"Review and approve application to {application.opportunity.company}"
-        )
-        
-        # Wait for user response (timeout after 24 hours)
-        approval = await self.application_service.wait_for_approval(
-            application.id,
-            timeout_hours=24
+            message=f"Review and approve application to {opportunity.company}"
         )
-        
-        return approval
     
     async def _submit_application(
         self,
@@ -398,37 +617,46 @@ class JobApplicationPipeline:
             logger.error("Application submission error", error=str(e))
             return {'success': False, 'error': str(e)}
     
-    async def _schedule_followups(self, application: Application):
+    async def _schedule_followups(self, application: Application, opportunity: Opportunity):
         """Schedule follow-up reminders for the application"""
         
-        from src.config.settings import settings
+        now = datetime.utcnow()
+        message = f"Follow up on application to {opportunity.company}"
         
-        for days in settings.APPLICATION_FOLLOWUP_DAYS:
-            await self.notification_service.schedule_reminder(
-                user_id=self.user_id,
-                application_id=application.id,
-                days_from_now=days,
-                message=f"Follow up on application to {application.opportunity.company}"
-            )
+        # All follow-ups go out in one insert instead of a round trip each
+        await self.notification_service.schedule_reminders_bulk([
+            {
+                "user_id": self.user_id,
+                "application_id": application.id,
+                "due_at": now + timedelta(days=days),
+                "message": message,
+            }
+            for days in settings.APPLICATION_FOLLOWUP_DAYS
+        ])
     
-    async def _send_daily_summary(self, applications: List[Application]):
+    async def _send_daily_summary(self, submitted: List[Tuple[Opportunity, Application]]):
         """Send daily summary of applications to user"""
         
-        summary = f"""
+        header = f"""
         Daily Job Application Summary
         
-        Applications Submitted: {len(applications)}
+        Applications Submitted: {len(submitted)}
         
         Details:
         """
         
-        for app in applications:
-            summary += f"\n- {app.opportunity.title} at {app.opportunity.company}"
+        # Bounded list, joined once
+        lines = [
+            f"- {opportunity.title} at {opportunity.company}"
+            for opportunity, _ in submitted[:SUMMARY_MAX_ITEMS]
+        ]
+        if len(submitted) > SUMMARY_MAX_ITEMS:
+            lines.append(f"... and {len(submitted) - SUMMARY_MAX_ITEMS} more")
         
         await self.notification_service.send_email(
             user_id=self.user_id,
             subject="Your Daily Job Application Summary",
-            body=summary
+            body=header + "\n" + "\n".join(lines)
         )
     
     async def _get_user_search_criteria(self) -> Dict[str, Any]:
@@ -447,34 +675,112 @@ class JobApplicationPipeline:
         }
     
     def _deduplicate_opportunities(self, opportunities: List[Opportunity]) -> List[Opportunity]:
-        """Remove duplicate opportunities based on URL and title"""
+        """Remove duplicate opportunities based on normalized URL, title and company"""
         
-        seen = set()
-        unique = []
+        unique: Dict[bytes, Opportunity] = {}
         
         for opp in opportunities:
-            key = (opp.url, opp.title, opp.company)
-            if key not in seen:
-                seen.add(key)
-                unique.append(opp)
-        
-        return unique
+            key = hashlib.blake2b(
+                f"{_normalize_url(opp.url)}|{(opp.title or '').strip().lower()}|{(opp.company or '').strip().lower()}".encode(),
+                digest_size=16
+            ).digest()
+            # Keep the listing with the fuller description; order follows first sighting
+            existing = unique.get(key)
+            if existing is None or len(opp.description or '') > len(existing.description or ''):
+                unique[key] = opp
+        
+        return list(unique.values())
+
+
+# Users whose pipelines run at once, and user ids fetched per cursor round trip
+ALL_USERS_CONCURRENCY = 16
+ALL_USERS_CHUNK_SIZE = 100
 
 
 # Celery task for automated daily job search
-async def run_daily_job_search_for_all_users():
-    """Run daily job search for all users with auto-apply enabled"""
+async def get_auto_apply_user_ids() -> List[str]:
+    """Get ids of all users with auto-apply enabled"""
     
     from src.models.database import User
     
     async with get_db() as db:
-        # Get all users with auto-apply enabled
-        users = await db.query(User).filter(User.auto_apply_enabled == True).all()
-        
-        for user in users:
-            try:
-                pipeline = JobApplicationPipeline(user.id)
-                await pipeline.run_daily_job_search()
-            except Exception as e:
-                logger.error(f"Error in daily job search for user", user_id=user.id, error=str(e))
-                continue
+        result = await db.execute(
+            select(User.id).where(User.auto_apply_enabled == True)
+        )
+        return list(result.scalars())
+
+
+async def run_daily_job_search_for_user(
+    user_id: str,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> Optional[Dict[str, Any]]:
+    """Run one user's daily job search, logging instead of raising on failure"""
+    
+    try:
+        pipeline = JobApplicationPipeline(user_id, http_client=http_client)
+        return await pipeline.run_daily_job_search()
+    except Exception as e:
+        logger.error(f"Error in daily job search for user", user_id=user_id, error=str(e))
+        return None
+
+
+async def submit_approved_application(
+    user_id: str,
+    application_id: str,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> Optional[Dict[str, Any]]:
+    """Submit an approved application, logging instead of raising on failure"""
+    
+    pipeline = JobApplicationPipeline(user_id, http_client=http_client)
+    try:
+        application = await pipeline.submit_approved_application(application_id)
+    except Exception as e:
+        logger.error("Error submitting approved application", application_id=application_id, error=str(e))
+        return None
+    finally:
+        await pipeline.aclose()
+    
+    if application is None:
+        return None
+    return {
+        "id": application.id,
+        "status": application.status,
+        "confirmation_number": application.confirmation_number
+    }
+
+
+async def run_daily_job_search_for_all_users():
+    """
+    Run daily job search for all users with auto-apply enabled
+    
+    Runs every user in this process; the Celery beat task fans the same
+    work out across workers instead.
+    """
+    
+    from src.models.database import User
+    
+    sem = asyncio.Semaphore(ALL_USERS_CONCURRENCY)
+    
+    async def _run_for_user(user_id: str):
+        async with sem:
+            await run_daily_job_search_for_user(user_id)
+    
+    # Each page of ids is read in its own short session, which is closed
+    # before that page's pipelines start
+    last_id = None
+    while True:
+        async with get_db() as db:
+            stmt = select(User.id).where(User.auto_apply_enabled == True)
+            if last_id is not None:
+                stmt = stmt.where(User.id > last_id)
+            result = await db.execute(stmt.order_by(User.id).limit(ALL_USERS_CHUNK_SIZE))
+            user_ids = list(result.scalars())
+        
+        if not user_ids:
+            return
+        
+        await asyncio.gather(*[_run_for_user(user_id) for user_id in user_ids])
+        
+        if len(user_ids) < ALL_USERS_CHUNK_SIZE:
+            return
+        last_id = user_ids[-1]
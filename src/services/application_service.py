@@ -2,99 +2,256 @@
 Application service for managing job applications
 """
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
 import structlog
+from redis.exceptions import RedisError
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from src.models.database import Application, ApplicationStatus
 from src.database.session import get_db
+from src.services.cache_service import get_redis
+from src.worker.celery_app import submit_approved_application_task
 
 logger = structlog.get_logger()
 
+# Published when a user approves or rejects an application, so waiters in
+# other worker processes wake up too
+APPROVAL_CHANNEL = "app_approved:{}"
+
+# Statuses that end the wait for a user decision
+DECIDED_STATUSES = {ApplicationStatus.APPROVED, ApplicationStatus.REJECTED}
+
+
+@asynccontextmanager
+async def _use_session(db: Optional[AsyncSession]) -> AsyncIterator[AsyncSession]:
+    """Use the caller's request session, or open a short-lived one"""
+    if db is not None:
+        yield db
+    else:
+        async with get_db() as session:
+            yield session
+
 
 class ApplicationService:
     """Service for managing job applications"""
     
+    # Shared by every instance in the process: application_id -> decision event
+    _pending: Dict[str, asyncio.Event] = {}
+    _listener: Optional[asyncio.Task] = None
+    _listener_lock = asyncio.Lock()
+    
     async def get_user_applications(
         self,
         user_id: str,
         status: Optional[ApplicationStatus] = None,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, str]] = None,
+        db: Optional[AsyncSession] = None
     ) -> List[Application]:
-        """Get user's applications"""
+        """
+        Get user's applications, newest first
+        
+        Args:
+            after: (created_at, id) of the last application on the previous
+                page; pages seek past it on the index instead of using OFFSET
+        """
         
-        async with get_db() as db:
-            query = db.query(Application).filter(Application.user_id == user_id)
+        async with _use_session(db) as db:
+            stmt = select(Application).where(Application.user_id == user_id)
             
             if status:
-                query = query.filter(Application.status == status)
+                stmt = stmt.where(Application.status == status)
+            
+            if after:
+                created_at, application_id = after
+                stmt = stmt.where(or_(
+                    Application.created_at < created_at,
+                    and_(Application.created_at == created_at, Application.id < application_id)
+                ))
             
-            query = query.order_by(Application.created_at.desc()).limit(limit)
+            stmt = stmt.order_by(Application.created_at.desc(), Application.id.desc()).limit(limit)
             
-            applications = await query.all()
-            return applications
+            result = await db.execute(stmt)
+            return result.scalars().all()
     
-    async def get_application(self, application_id: str) -> Optional[Application]:
+    async def get_application(self, application_id: str, db: Optional[AsyncSession] = None) -> Optional[Application]:
         """Get specific application"""
         
-        async with get_db() as db:
-            application = await db.query(Application).filter(
+        async with _use_session(db) as db:
+            stmt = select(Application).options(
+                undefer(Application.cover_letter)
+            ).where(
                 Application.id == application_id
-            ).first()
-            return application
+            )
+            result = await db.execute(stmt)
+            return result.scalars().first()
     
-    async def update_application(self, application: Application) -> Application:
+    async def update_application(self, application: Application, db: Optional[AsyncSession] = None) -> Application:
         """Update application"""
         
-        async with get_db() as db:
+        async with _use_session(db) as db:
             db.add(application)
             await db.commit()
             await db.refresh(application)
             return application
     
-    async def approve_and_submit(self, application: Application) -> Dict[str, Any]:
-        """Approve and submit application"""
+    async def approve_and_submit(self, application: Application, db: Optional[AsyncSession] = None) -> Dict[str, Any]:
+        """
+        Approve an application awaiting approval and queue its submission
+        
+        The status only moves out of PENDING_APPROVAL once, so a repeated
+        approval never queues a second submission.
+        """
+        
+        async with _use_session(db) as db:
+            result = await db.execute(
+                update(Application).where(
+                    Application.id == application.id,
+                    Application.status == ApplicationStatus.PENDING_APPROVAL
+                ).values(status=ApplicationStatus.APPROVED)
+            )
+            # Committed before queueing, so the worker sees the approval
+            await db.commit()
         
-        application.status = ApplicationStatus.APPROVED
-        await self.update_application(application)
+        if result.rowcount != 1:
+            return {"success": False, "message": "Application is not awaiting approval"}
         
-        # Submit logic here
-        return {"success": True, "message": "Application submitted"}
+        await self.notify_decision(application.id)
+        task = submit_approved_application_task.delay(application.user_id, application.id)
+        return {"success": True, "task_id": task.id, "message": "Application approved, submission queued"}
     
-    async def reject_application(self, application: Application, notes: Optional[str] = None):
+    async def reject_application(self, application: Application, notes: Optional[str] = None, db: Optional[AsyncSession] = None):
         """Reject application"""
         
         application.status = ApplicationStatus.REJECTED
         if notes:
             application.notes = notes
-        await self.update_application(application)
+        await self.update_application(application, db=db)
+        await self.notify_decision(application.id)
+    
+    async def notify_decision(self, application_id: str):
+        """Wake anything waiting on this application's approval"""
+        
+        event = self._pending.get(application_id)
+        if event is not None:
+            event.set()
+        
+        try:
+            await get_redis().publish(APPROVAL_CHANNEL.format(application_id), "1")
+        except RedisError as e:
+            logger.warning("approval_publish_failed", application_id=application_id, error=str(e))
     
     async def wait_for_approval(self, application_id: str, timeout_hours: int = 24) -> bool:
-        """Wait for user approval"""
-        # Implementation for waiting for approval
-        # This would typically use a queue or webhook system
-        return False
+        """
+        Wait for user approval
+        
+        Sleeps on an in-process event that notify_decision sets, either
+        directly or through the Redis listener, instead of polling the
+        database. The stored status is read once the wait ends.
+        
+        Returns:
+            True if the application was approved before the timeout
+        """
+        event = self._pending.setdefault(application_id, asyncio.Event())
+        try:
+            await self._ensure_listener()
+        except RedisError as e:
+            # Decisions made in this process still wake the waiter
+            logger.warning("approval_listener_unavailable", application_id=application_id, error=str(e))
+        
+        try:
+            # The decision may have landed before we started waiting
+            application = await self.get_application(application_id)
+            if application is None:
+                return False
+            
+            if application.status not in DECIDED_STATUSES:
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=timeout_hours * 3600)
+                except asyncio.TimeoutError:
+                    logger.info("approval_wait_timed_out", application_id=application_id)
+                    return False
+                application = await self.get_application(application_id)
+            
+            return application is not None and application.status == ApplicationStatus.APPROVED
+        finally:
+            self._pending.pop(application_id, None)
+    
+    @classmethod
+    async def _ensure_listener(cls):
+        # One pattern subscription per process serves every waiter. It is
+        # confirmed before returning, so the status check that follows can't
+        # miss a decision published in between.
+        async with cls._listener_lock:
+            if cls._listener is not None and not cls._listener.done():
+                return
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.psubscribe(APPROVAL_CHANNEL.format("*"))
+            except RedisError:
+                await pubsub.close()
+                raise
+            cls._listener = asyncio.create_task(cls._listen_for_decisions(pubsub))
+    
+    @classmethod
+    async def _listen_for_decisions(cls, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                application_id = message["channel"].decode().split(":", 1)[1]
+                event = cls._pending.get(application_id)
+                if event is not None:
+                    event.set()
+        except RedisError as e:
+            # Waiters still wake on in-process decisions; the next wait restarts the listener
+            logger.warning("approval_listener_failed", error=str(e))
+        finally:
+            await pubsub.close()
     
-    async def check_application_status(self, application_id: str) -> str:
+    async def check_application_status(self, application_id: str, db: Optional[AsyncSession] = None) -> str:
         """Check application status"""
-        application = await self.get_application(application_id)
+        application = await self.get_application(application_id, db=db)
         return application.status if application else "unknown"
     
-    async def get_user_stats(self, user_id: str) -> Dict[str, Any]:
+    async def get_user_stats(self, user_id: str, db: Optional[AsyncSession] = None) -> Dict[str, Any]:
         """Get user application statistics"""
         
-        async with get_db() as db:
-            total = await db.query(Application).filter(
-                Application.user_id == user_id
-            ).count()
-            
-            submitted = await db.query(Application).filter(
-                Application.user_id == user_id,
-                Application.status == ApplicationStatus.SUBMITTED
-            ).count()
+        stats = await self.get_stats_for_users([user_id], db=db)
+        return stats[user_id]
+    
+    async def get_stats_for_users(
+        self,
+        user_ids: List[str],
+        db: Optional[AsyncSession] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get application statistics for several users in one query"""
+        
+        counts: Dict[str, Dict[ApplicationStatus, int]] = {user_id: {} for user_id in user_ids}
+        if not user_ids:
+            return {}
+        
+        async with _use_session(db) as db:
+            # One grouped scan instead of a round trip per user and count
+            stmt = select(Application.user_id, Application.status, func.count()).where(
+                Application.user_id.in_(user_ids)
+            ).group_by(Application.user_id, Application.status)
             
-            return {
+            for user_id, status, count in (await db.execute(stmt)).all():
+                counts[user_id][status] = count
+        
+        stats = {}
+        for user_id, by_status in counts.items():
+            total = sum(by_status.values())
+            submitted = by_status.get(ApplicationStatus.SUBMITTED, 0)
+            stats[user_id] = {
                 "total_applications": total,
                 "submitted": submitted,
                 "pending_approval": total - submitted
             }
+        return stats
@@ -0,0 +1,85 @@
+"""
+Artifact service for reusing generated application materials
+"""
+
+from typing import Any, Dict, Optional
+import hashlib
+from sqlalchemy import select
+
+from src.models.database import GeneratedArtifact, Resume, generate_uuid
+from src.database.session import get_db
+
+# Bump when the resume or cover-letter prompts change so stale artifacts are not reused
+TEMPLATE_VERSION = "1"
+
+RESUME_VARIANT = "resume_variant"
+COVER_LETTER = "cover_letter"
+
+
+def job_hash(company: Optional[str], title: Optional[str], job_description: str) -> str:
+    """
+    Content hash of a job posting
+    
+    Company and title are included because cover letters name them, so the
+    same description posted by two companies gets separate artifacts.
+    """
+    parts = [company or "", title or "", job_description]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def snapshot_hash(user_id: str, resume: Optional[Resume]) -> str:
+    """
+    Hash of everything besides the job that shapes generated materials
+    
+    The base resume's updated_at is included, so editing the resume
+    invalidates every artifact generated from the previous version.
+    """
+    parts = [
+        user_id,
+        resume.id if resume else "",
+        resume.updated_at.isoformat() if resume and resume.updated_at else "",
+        TEMPLATE_VERSION,
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class ArtifactService:
+    """Service for cached resume variants and cover letters"""
+    
+    async def get_artifacts(self, user_id: str, job_hash: str, input_snapshot_hash: str) -> Dict[str, Any]:
+        """Get stored artifacts for a job, keyed by type"""
+        
+        async with get_db() as db:
+            result = await db.execute(
+                select(GeneratedArtifact.type, GeneratedArtifact.content).where(
+                    GeneratedArtifact.user_id == user_id,
+                    GeneratedArtifact.job_hash == job_hash,
+                    GeneratedArtifact.input_snapshot_hash == input_snapshot_hash
+                )
+            )
+            return dict(result.all())
+    
+    async def save_artifacts(
+        self,
+        user_id: str,
+        job_hash: str,
+        input_snapshot_hash: str,
+        artifacts: Dict[str, Any]
+    ):
+        """Store newly generated artifacts"""
+        
+        if not artifacts:
+            return
+        
+        async with get_db() as db:
+            await GeneratedArtifact.bulk_upsert(db, [
+                {
+                    "id": generate_uuid(),
+                    "user_id": user_id,
+                    "job_hash": job_hash,
+                    "type": artifact_type,
+                    "content": content,
+                    "input_snapshot_hash": input_snapshot_hash,
+                }
+                for artifact_type, content in artifacts.items()
+            ])
@@ -0,0 +1,144 @@
+"""
+Redis-backed caching helpers
+"""
+
+import copy
+import functools
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+import redis.asyncio as redis
+import structlog
+
+from src.config.settings import settings
+
+logger = structlog.get_logger()
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Get or create the shared Redis client"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts"""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _is_error_result(result: Any) -> bool:
+    return isinstance(result, dict) and "error" in result
+
+
+def llm_cached(
+    system_message: str,
+    ttl: int = 3600,
+    skip_if: Callable[[Any], bool] = _is_error_result
+):
+    """
+    Cache the result of an async LLM method in Redis
+
+    The key covers the model, the agent's system prompt and the call
+    arguments, so identical (job, resume) requests skip the LLM entirely.
+    Results matching skip_if (errors by default) are never cached, and
+    Redis failures fall through to the wrapped method.
+
+    Args:
+        system_message: System prompt of the agent answering the call
+        ttl: Time to live in seconds
+        skip_if: Predicate for results that must not be cached
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = "llm:{}:{}".format(
+                func.__name__,
+                make_cache_key(settings.OPENAI_MODEL, system_message, args, kwargs)
+            )
+            client = get_redis()
+
+            try:
+                cached = await client.get(key)
+            except redis.RedisError as e:
+                logger.warning("llm_cache_unavailable", error=str(e))
+                cached = None
+
+            if cached is not None:
+                logger.info("llm_cache_hit", method=func.__name__)
+                return json.loads(cached)
+
+            result = await func(self, *args, **kwargs)
+
+            if not skip_if(result):
+                try:
+                    await client.set(key, json.dumps(result), ex=ttl)
+                except redis.RedisError as e:
+                    logger.warning("llm_cache_store_failed", error=str(e))
+
+            return result
+        return wrapper
+    return decorator
+
+
+def memory_cached(
+    maxsize: int = 1024,
+    ttl: int = 3600,
+    skip_if: Callable[[Any], bool] = _is_error_result
+):
+    """
+    Cache the result of an async method in process memory
+    
+    An LRU with a TTL, keyed by a hash of the call arguments (not the
+    instance), so repeated (job, resume) pairs skip the LLM even across
+    instances. Results matching skip_if are never cached.
+    
+    Results are deep-copied into the cache and again on every hit, so a
+    caller mutating its result can't change what other callers get. Cache
+    plain data (dicts, lists, strings), not ORM objects.
+    
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Time to live in seconds
+        skip_if: Predicate for results that must not be cached
+    """
+    def decorator(func):
+        entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = make_cache_key(func.__qualname__, args, kwargs)
+            
+            entry = entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > time.monotonic():
+                    entries.move_to_end(key)
+                    logger.info("memory_cache_hit", method=func.__name__)
+                    return copy.deepcopy(result)
+                del entries[key]
+            
+            result = await func(self, *args, **kwargs)
+            
+            if not skip_if(result):
+                entries[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            
+            return result
+        
+        def cache_invalidate(*args, **kwargs):
+            """Drop the entry for one set of call arguments (without self)"""
+            entries.pop(make_cache_key(func.__qualname__, args, kwargs), None)
+        
+        wrapper.cache_clear = entries.clear
+        wrapper.cache_invalidate = cache_invalidate
+        return wrapper
+    return decorator
@@ -3,11 +3,20 @@ Job scraper service for multiple job boards
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import atexit
+import itertools
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 import structlog
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
 from bs4 import BeautifulSoup
 import httpx
+import orjson
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -18,17 +27,309 @@ from src.config.settings import settings
 
 logger = structlog.get_logger()
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+# Concurrent requests per job board host, and retries for throttled or unavailable responses
+HOST_CONCURRENCY = 8
+MAX_ATTEMPTS = 5
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_RETRY_DELAY = 30.0
+
+# Largest response body read from a job board; anything beyond is discarded
+MAX_RESPONSE_BYTES = 2_000_000
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as seconds or an HTTP date"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Pooled HTTP client for job board requests
+    
+    Keep-alive connections are reused across searches, so bursts to the
+    same board skip the TCP and TLS handshakes.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60),
+        headers=DEFAULT_HEADERS
+    )
+
+
+# Opportunity field -> key path in each board's job JSON
+FIELD_MAP = {
+    'indeed': {
+        'title': ('jobtitle',),
+        'company': ('company',),
+        'location': ('formattedLocation',),
+        'url': ('url',),
+        'description': ('snippet',),
+    },
+    'linkedin': {
+        'title': ('title',),
+        'company': ('company', 'name'),
+        'location': ('location',),
+        'url': ('url',),
+        'description': ('description',),
+    },
+    'glassdoor': {
+        'title': ('jobTitle',),
+        'company': ('employer',),
+        'location': ('location',),
+        'url': ('jobLink',),
+        'description': ('jobDescription',),
+    },
+}
+
+
+def _pluck(row: Dict, path: Tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts, defaulting to an empty string"""
+    value = row
+    for key in path:
+        if not isinstance(value, dict):
+            return ''
+        value = value.get(key, '')
+    return value
+
+
+# Search endpoints; query parameters are encoded by httpx
+INDEED_SEARCH_URL = 'https://api.indeed.com/ads/apisearch'
+LINKEDIN_SEARCH_URL = 'https://api.linkedin.com/v2/jobSearch'
+GLASSDOOR_SEARCH_URL = 'https://api.glassdoor.com/api/api.htm'
+
+# Indeed Easy Apply form endpoint. Only a rejected post (4xx or captcha)
+# falls back to the browser; an accepted post without a JSON confirmation
+# may still have gone through, so it is reported as unconfirmed instead
+INDEED_APPLY_URL = 'https://apply.indeed.com/indeedapply/submit'
+INDEED_CONFIRMATION_KEYS = ('applicationId', 'confirmationId', 'applyId')
+
+
+def _indeed_confirmation(response: httpx.Response) -> Optional[str]:
+    """Confirmation id from an Easy Apply response, or None if it doesn't confirm a submission"""
+    if 'json' not in response.headers.get('content-type', ''):
+        return None
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(body, dict) or body.get('success') is False:
+        return None
+    for key in INDEED_CONFIRMATION_KEYS:
+        if body.get(key):
+            return str(body[key])
+    return None
+
+
+# Sets the cover letter, firing the events the form listens for, and returns
+# the resume upload input
+FILL_INDEED_FORM_SCRIPT = """
+const coverLetter = document.getElementById('cover-letter');
+coverLetter.value = arguments[0];
+coverLetter.dispatchEvent(new Event('input', {bubbles: true}));
+coverLetter.dispatchEvent(new Event('change', {bubbles: true}));
+return document.getElementById('resume-upload');
+"""
+
+
+def _indeed_job_key(job_url: str) -> Optional[str]:
+    """Indeed job key from a viewjob URL's jk parameter"""
+    return parse_qs(urlsplit(job_url).query).get('jk', [None])[0]
+
+
+# Process-wide, so two submissions in the same second never share a number
+_confirmation_seq = itertools.count()
+
+
+def _confirmation_number(prefix: str) -> str:
+    """Confirmation number from the Unix time in seconds plus a sequence number"""
+    return f"{prefix}-{int(time.time())}-{next(_confirmation_seq):06d}"
+
+
+# Elements holding the job posting on each board, tried in order
+JOB_DESCRIPTION_SELECTORS = {
+    'indeed.com': ('#jobDescriptionText', 'div.jobsearch-JobComponent'),
+    'linkedin.com': ('div.show-more-less-html__markup', 'div.description__text'),
+    'glassdoor.com': ('div.jobDescriptionContent', '[class*="JobDetails_jobDescription"]'),
+}
+FALLBACK_DESCRIPTION_SELECTORS = ('main', 'article', 'body')
+
+# Headless Chrome tuned for scripted form submission: no background
+# throttling, extensions, crash reporting or audio
+CHROME_ARGUMENTS = (
+    '--headless=new',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-extensions',
+    '--disable-breakpad',
+    '--disable-ipc-flooding-protection',
+    '--disable-features=TranslateUI',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--window-size=1280,800',
+)
+
+
+class WebDriverPool:
+    """
+    Warm headless Chrome sessions reused across application submissions
+    
+    Up to `size` drivers are started on demand and kept open; checking one
+    back in clears its cookies and localStorage so no session state leaks
+    between applications. Slots are an asyncio.Semaphore, so a cancelled
+    waiter never holds one; browser start-up and reset run in threads.
+    """
+    
+    def __init__(self, size: int = 4):
+        self.size = size
+        self._idle: List[webdriver.Chrome] = []
+        self._lock = threading.Lock()
+        self._slots = asyncio.Semaphore(size)
+    
+    async def acquire(self) -> webdriver.Chrome:
+        await self._slots.acquire()
+        try:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                driver = await asyncio.to_thread(self._new)
+        except BaseException:
+            self._slots.release()
+            raise
+        return driver
+    
+    async def release(self, driver: webdriver.Chrome):
+        try:
+            await asyncio.to_thread(self._reset, driver)
+        finally:
+            self._slots.release()
+    
+    def _reset(self, driver: webdriver.Chrome):
+        """Clear a driver's session state and return it to the idle list"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear();")
+        except Exception as e:
+            # A driver that can't be reset is discarded; a fresh one replaces it on demand
+            logger.warning("Discarding Selenium driver", error=str(e))
+            self._quit(driver)
+        else:
+            with self._lock:
+                self._idle.append(driver)
+    
+    def close(self):
+        """Quit every idle driver"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+    
+    @staticmethod
+    def _new() -> webdriver.Chrome:
+        """Start a configured headless Chrome"""
+        
+        options = webdriver.ChromeOptions()
+        for argument in CHROME_ARGUMENTS:
+            options.add_argument(argument)
+        # Skip images and notification prompts; the apply flow only needs the DOM
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
+        return webdriver.Chrome(options=options)
+    
+    @staticmethod
+    def _quit(driver: webdriver.Chrome):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+# Shared by every scraper in the process, which runs them on one event loop
+driver_pool = WebDriverPool()
+atexit.register(driver_pool.close)
+
 
 class JobScraperService:
     """
     Scrapes job postings from multiple sources
     """
     
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # A client passed in is shared and closed by its owner
+        self._owns_client = client is None
+        self.client = client or create_http_client()
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    async def aclose(self):
+        """Close the pooled HTTP client if this service created it"""
+        if self._owns_client:
+            await self.client.aclose()
+    
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET with a per-host concurrency cap and retries with exponential backoff
+        
+        429 and 502-504 responses are retried, waiting for Retry-After when
+        the board sends it. The last response is returned either way.
+        
+        Bodies are streamed and cut off at MAX_RESPONSE_BYTES, so a bloated
+        page can't exhaust worker memory.
+        """
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.setdefault(host, asyncio.Semaphore(HOST_CONCURRENCY))
+        
+        for attempt in range(MAX_ATTEMPTS):
+            async with semaphore:
+                response = await self._fetch_capped(url, **kwargs)
+            
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                return response
+            
+            # The slot is released while waiting, so other requests to the host proceed
+            delay = _retry_after(response)
+            if delay is None:
+                delay = min(2 ** attempt, MAX_RETRY_DELAY) + random.random()
+            logger.warning("Job board request throttled", host=host, status=response.status_code, retry_in=delay)
+            await asyncio.sleep(min(delay, MAX_RETRY_DELAY))
+        
+        return response
+    
+    async def _fetch_capped(self, url: str, **kwargs) -> httpx.Response:
+        async with self.client.stream('GET', url, **kwargs) as streamed:
+            body = bytearray()
+            async for chunk in streamed.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_RESPONSE_BYTES:
+                    logger.warning("Response truncated", url=url, limit=MAX_RESPONSE_BYTES)
+                    del body[MAX_RESPONSE_BYTES:]
+                    break
+        
+        # aiter_bytes already undid any Content-Encoding, so drop the headers describing the wire body
+        headers = [
+            (name, value) for name, value in streamed.headers.multi_items()
+            if name.lower() not in ('content-encoding', 'content-length')
+        ]
+        return httpx.Response(streamed.status_code, headers=headers, content=bytes(body), request=streamed.request)
     
     async def search_indeed(
         self,
@@ -55,12 +356,10 @@ class JobScraperService:
             # Note: Indeed requires API key for official access
             # This is a simplified example
             if settings.INDEED_API_KEY:
-                url = f"https://api.indeed.com/ads/apisearch?{self._build_query_string(params)}"
-                response = await self.client.get(url, headers=self.headers)
-                data = response.json()
+                response = await self._get(INDEED_SEARCH_URL, params=params)
+                data = orjson.loads(response.content)
                 
-                for job in data.get('results', []):
-                    opportunities.append(self._parse_indeed_job(job))
+                opportunities = self._parse_batch('indeed', data.get('results', []))
             
         except Exception as e:
             logger.error("Error searching Indeed", error=str(e))
@@ -82,8 +381,8 @@ class JobScraperService:
         try:
             # LinkedIn Jobs API (requires authentication)
             if settings.LINKEDIN_JOBS_API_KEY:
+                # Merged with the client's default headers
                 headers = {
-                    **self.headers,
                     'Authorization': f'Bearer {settings.LINKEDIN_JOBS_API_KEY}'
                 }
                 
@@ -93,12 +392,10 @@ class JobScraperService:
                     'count': limit
                 }
                 
-                url = f"https://api.linkedin.com/v2/jobSearch?{self._build_query_string(params)}"
-                response = await self.client.get(url, headers=headers)
-                data = response.json()
+                response = await self._get(LINKEDIN_SEARCH_URL, params=params, headers=headers)
+                data = orjson.loads(response.content)
                 
-                for job in data.get('elements', []):
-                    opportunities.append(self._parse_linkedin_job(job))
+                opportunities = self._parse_batch('linkedin', data.get('elements', []))
                     
         except Exception as e:
             logger.error("Error searching LinkedIn", error=str(e))
@@ -131,30 +428,80 @@ class JobScraperService:
                     'pagesize': limit
                 }
                 
-                url = f"https://api.glassdoor.com/api/api.htm"
-                response = await self.client.get(url, params=params)
-                data = response.json()
+                response = await self._get(GLASSDOOR_SEARCH_URL, params=params)
+                data = orjson.loads(response.content)
                 
-                for job in data.get('response', {}).get('jobListings', []):
-                    opportunities.append(self._parse_glassdoor_job(job))
+                opportunities = self._parse_batch('glassdoor', data.get('response', {}).get('jobListings', []))
                     
         except Exception as e:
             logger.error("Error searching Glassdoor", error=str(e))
         
         return opportunities
     
+    async def search_all(
+        self,
+        query: str,
+        location: str = "",
+        limit: int = 50,
+        remote: bool = False,
+        sources: Sequence[str] = ("indeed", "linkedin", "glassdoor")
+    ) -> List[Opportunity]:
+        """
+        Search several job boards concurrently
+        
+        Each board is an independent HTTP call, so total latency is the
+        slowest board rather than the sum. A board that fails is logged
+        and skipped.
+        
+        Args:
+            query: Search keywords
+            location: Location filter
+            limit: Maximum results per board
+            remote: Restrict Indeed results to remote jobs
+            sources: Boards to search
+        """
+        searches = {
+            'indeed': lambda: self.search_indeed(query, location, remote=remote, limit=limit),
+            'linkedin': lambda: self.search_linkedin(query, location, limit=limit),
+            'glassdoor': lambda: self.search_glassdoor(query, location, limit=limit),
+        }
+        selected = [source for source in sources if source in searches]
+        
+        results = await asyncio.gather(
+            *[searches[source]() for source in selected],
+            return_exceptions=True
+        )
+        
+        opportunities = []
+        for source, result in zip(selected, results):
+            if isinstance(result, Exception):
+                logger.error("Job search failed", source=source, error=str(result))
+                continue
+            opportunities.extend(result)
+        
+        return opportunities
+    
     async def extract_job_details(self, url: str) -> Dict[str, Any]:
         """Extract full job details from a URL"""
         
         try:
-            response = await self.client.get(url, headers=self.headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = await self._get(url)
+            soup = BeautifulSoup(response.text, 'lxml')
             
-            # This is highly site-specific and would need customization
-            # for each job board
+            # Keep only the posting body so prompts don't carry the whole page
+            host = httpx.URL(url).host
+            selectors = next(
+                (selectors for suffix, selectors in JOB_DESCRIPTION_SELECTORS.items() if host.endswith(suffix)),
+                ()
+            )
+            content = None
+            for selector in (*selectors, *FALLBACK_DESCRIPTION_SELECTORS):
+                content = soup.select_one(selector)
+                if content is not None:
+                    break
             
             return {
-                'description': soup.get_text(),
+                'description': (content or soup).get_text(' ', strip=True),
                 'requirements': [],
                 'benefits': []
             }
@@ -163,51 +510,53 @@ class JobScraperService:
             logger.error("Error extracting job details", url=url, error=str(e))
             return {}
     
+    async def extract_many(self, urls: Iterable[str], concurrency: int = 64) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract job details for many URLs with bounded concurrency
+        
+        A fixed set of workers pulls URLs from one shared iterator, so only
+        `concurrency` fetches (and coroutines) exist at a time however many
+        URLs are passed. Per-host limits from _get still apply.
+        
+        Returns:
+            Details keyed by URL; failed extractions map to an empty dict
+        """
+        pending = iter(urls)
+        details: Dict[str, Dict[str, Any]] = {}
+        
+        async def worker():
+            for url in pending:
+                details[url] = await self.extract_job_details(url)
+        
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return details
+    
     async def submit_indeed_application(
         self,
         job_url: str,
         resume_file: str,
         cover_letter: str
     ) -> Dict[str, Any]:
-        """Submit application through Indeed"""
+        """
+        Submit application through Indeed
+        
+        Posts the Easy Apply form over the pooled HTTP client, and only
+        drives a browser when the form post was rejected or couldn't be
+        made. A post that was accepted without a confirmation is reported as
+        unconfirmed and never resubmitted.
+        """
         
         logger.info("Submitting Indeed application", url=job_url)
         
         try:
-            # This requires Selenium for automation
-            driver = self._get_selenium_driver()
-            
-            driver.get(job_url)
-            
-            # Click Apply button
-            apply_button = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "apply-button"))
-            )
-            apply_button.click()
-            
-            # Fill application form
-            # Upload resume
-            resume_input = driver.find_element(By.ID, "resume-upload")
-            resume_input.send_keys(resume_file)
-            
-            # Fill cover letter
-            cover_letter_field = driver.find_element(By.ID, "cover-letter")
-            cover_letter_field.send_keys(cover_letter)
-            
-            # Submit
-            submit_button = driver.find_element(By.ID, "submit-application")
-            submit_button.click()
-            
-            # Wait for confirmation
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "confirmation"))
-            )
-            
-            driver.quit()
+            result = await self._submit_indeed_via_api(job_url, resume_file, cover_letter)
+            if result is not None:
+                return result
             
+            await self._submit_indeed_via_selenium(job_url, resume_file, cover_letter)
             return {
                 'success': True,
-                'confirmation_number': 'IND-' + datetime.utcnow().strftime('%Y%m%d%H%M%S'),
+                'confirmation_number': _confirmation_number('IND'),
                 'method': 'indeed'
             }
             
@@ -215,6 +564,95 @@ class JobScraperService:
             logger.error("Error submitting Indeed application", error=str(e))
             return {'success': False, 'error': str(e)}
     
+    async def _submit_indeed_via_api(
+        self,
+        job_url: str,
+        resume_file: str,
+        cover_letter: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Submit the Easy Apply form directly
+        
+        Returns:
+            The submission result, or None when nothing was submitted and the
+            browser flow should be used (no job key, a 4xx response or a
+            captcha). A 2xx without a JSON confirmation, such as a login page
+            served as 200, is returned as unconfirmed; server errors are raised
+        """
+        job_key = _indeed_job_key(job_url)
+        if not job_key:
+            return None
+        
+        resume = Path(resume_file)
+        content = await asyncio.to_thread(resume.read_bytes)
+        
+        semaphore = self._host_semaphores.setdefault(
+            httpx.URL(INDEED_APPLY_URL).host, asyncio.Semaphore(HOST_CONCURRENCY)
+        )
+        async with semaphore:
+            response = await self.client.post(
+                INDEED_APPLY_URL,
+                data={'coverLetter': cover_letter, 'jobKey': job_key},
+                files={'resume': (resume.name, content)}
+            )
+        
+        if response.is_client_error or 'captcha' in response.text.lower():
+            logger.info("Indeed form rejected, using browser", url=job_url, status=response.status_code)
+            return None
+        
+        response.raise_for_status()
+        
+        confirmation = _indeed_confirmation(response)
+        if confirmation is None:
+            logger.warning("Indeed form not confirmed", url=job_url, status=response.status_code)
+            return {'success': False, 'error': 'unconfirmed', 'method': 'indeed'}
+        
+        return {
+            'success': True,
+            'confirmation_number': confirmation,
+            'method': 'indeed'
+        }
+    
+    async def _submit_indeed_via_selenium(self, job_url: str, resume_file: str, cover_letter: str):
+        """Submit through the Apply button in a pooled browser"""
+        driver = await driver_pool.acquire()
+        # WebDriver calls block, so the whole flow runs in a thread
+        flow = asyncio.ensure_future(
+            asyncio.to_thread(self._fill_indeed_form, driver, job_url, resume_file, cover_letter)
+        )
+        try:
+            await asyncio.shield(flow)
+        finally:
+            # Even when the caller is cancelled, the thread finishes with the
+            # driver before it goes back to the pool
+            await asyncio.wait([flow])
+            await driver_pool.release(driver)
+    
+    @staticmethod
+    def _fill_indeed_form(driver: webdriver.Chrome, job_url: str, resume_file: str, cover_letter: str):
+        """Drive the Indeed apply flow in a browser (blocking)"""
+        driver.get(job_url)
+        
+        # Click Apply button
+        apply_button = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "apply-button"))
+        )
+        apply_button.click()
+        
+        # Fill application form: one script call fills the cover letter and
+        # returns the resume input, whose file can only be set via send_keys
+        resume_input = driver.execute_script(FILL_INDEED_FORM_SCRIPT, cover_letter)
+        resume_input.send_keys(resume_file)
+        
+        # Submit
+        submit_button = driver.find_element(By.ID, "submit-application")
+        submit_button.click()
+        
+        # Wait for confirmation
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "confirmation"))
+        )
+    
     async def submit_linkedin_application(
         self,
         job_url: str,
@@ -231,7 +669,7 @@ class JobScraperService:
             
             return {
                 'success': True,
-                'confirmation_number': 'LI-' + datetime.utcnow().strftime('%Y%m%d%H%M%S'),
+                'confirmation_number': _confirmation_number('LI'),
                 'method': 'linkedin'
             }
             
@@ -239,59 +677,18 @@ class JobScraperService:
             logger.error("Error submitting LinkedIn application", error=str(e))
             return {'success': False, 'error': str(e)}
     
-    def _parse_indeed_job(self, job_data: Dict) -> Opportunity:
-        """Parse Indeed job data into Opportunity model"""
-        
-        return Opportunity(
-            source='indeed',
-            title=job_data.get('jobtitle', ''),
-            company=job_data.get('company', ''),
-            location=job_data.get('formattedLocation', ''),
-            url=job_data.get('url', ''),
-            description=job_data.get('snippet', ''),
-            status=OpportunityStatus.IDENTIFIED,
-            discovered_at=datetime.utcnow()
-        )
-    
-    def _parse_linkedin_job(self, job_data: Dict) -> Opportunity:
-        """Parse LinkedIn job data into Opportunity model"""
-        
-        return Opportunity(
-            source='linkedin',
-            title=job_data.get('title', ''),
-            company=job_data.get('company', {}).get('name', ''),
-            location=job_data.get('location', ''),
-            url=job_data.get('url', ''),
-            description=job_data.get('description', ''),
-            status=OpportunityStatus.IDENTIFIED,
-            discovered_at=datetime.utcnow()
-        )
-    
-    def _parse_glassdoor_job(self, job_data: Dict) -> Opportunity:
-        """Parse Glassdoor job data into Opportunity model"""
-        
-        return Opportunity(
-            source='glassdoor',
-            title=job_data.get('jobTitle', ''),
-            company=job_data.get('employer', ''),
-            location=job_data.get('location', ''),
-            url=job_data.get('jobLink', ''),
-            description=job_data.get('jobDescription', ''),
-            status=OpportunityStatus.IDENTIFIED,
-            discovered_at=datetime.utcnow()
-        )
-    
-    def _get_selenium_driver(self):
-        """Get configured Selenium WebDriver"""
+    def _parse_batch(self, source: str, rows: List[Dict]) -> List[Opportunity]:
+        """Parse a board's job listings into Opportunity models"""
         
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        field_map = FIELD_MAP[source]
+        now = datetime.utcnow()
         
-        driver = webdriver.Chrome(options=options)
-        return driver
-    
-    def _build_query_string(self, params: Dict) -> str:
-        """Build URL query string from parameters"""
-        return '&'.join(f"{k}={v}" for k, v in params.items())
+        return [
+            Opportunity(
+                source=source,
+                status=OpportunityStatus.IDENTIFIED,
+                discovered_at=now,
+                **{field: _pluck(row, path) for field, path in field_map.items()}
+            )
+            for row in rows
+        ]
@@ -2,24 +2,88 @@
 LLM service for AI model interactions
 """
 
+from typing import Optional
+
+import structlog
 from openai import AsyncOpenAI
+from redis.exceptions import RedisError
+
 from src.config.settings import settings
+from src.monitoring.metrics import llm_cache_lookups
+from src.services.cache_service import get_redis, make_cache_key
+
+try:
+    # aiohttp spreads concurrent requests over more connections than the default httpx transport
+    from openai import DefaultAioHttpClient
+except ImportError:  # openai without the aiohttp extra
+    DefaultAioHttpClient = None
+
+
+logger = structlog.get_logger()
+
+# Exact-prompt responses live in Redis
+COMPLETION_CACHE_TTL = 24 * 3600
 
 
 class LLMService:
     """Service for interacting with LLM models"""
     
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=DefaultAioHttpClient() if DefaultAioHttpClient else None
+        )
+    
+    async def aclose(self):
+        """Release the client's HTTP session"""
+        await self.client.close()
     
     async def generate_completion(self, prompt: str, model: str = None) -> str:
-        """Generate completion from LLM"""
+        """
+        Generate completion from LLM
+        
+        Identical prompts for the same model are answered from Redis. Only
+        exact matches are reused: near-identical prompts (e.g. fit scoring
+        for a different batch of jobs) need their own answer.
+        """
         
         model = model or settings.DEFAULT_LLM_MODEL
+        key = "llm:completion:" + make_cache_key(model, prompt)
         
+        cached = await self._get_exact(key)
+        if cached is not None:
+            llm_cache_lookups.labels(tier="exact", result="hit").inc()
+            return cached
+        llm_cache_lookups.labels(tier="exact", result="miss").inc()
+        
+        content = await self._complete(model, prompt)
+        
+        if content is not None:
+            await self._set_exact(key, content)
+        
+        return content
+    
+    async def _complete(self, model: str, prompt: str) -> Optional[str]:
         response = await self.client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}]
         )
-        
         return response.choices[0].message.content
+    
+    async def _get_exact(self, key: str) -> Optional[str]:
+        try:
+            cached = await get_redis().get(key)
+        except RedisError as e:
+            logger.warning("llm_cache_unavailable", error=str(e))
+            return None
+        return cached.decode() if cached is not None else None
+    
+    async def _set_exact(self, key: str, content: str):
+        try:
+            await get_redis().set(key, content, ex=COMPLETION_CACHE_TTL)
+        except RedisError as e:
+            logger.warning("llm_cache_store_failed", error=str(e))
+
+
+# Shared instance so every caller reuses one HTTP connection pool
+llm_service = LLMService()
@@ -2,10 +2,15 @@
 Notification service for sending alerts
 """
 
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
 import structlog
+from sqlalchemy import insert
 
-logger = structlog.get_logger()
+from src.models.database import Task
+from src.database.session import get_db
 
+logger = structlog.get_logger()
 
 class NotificationService:
     """Service for sending notifications"""
@@ -16,7 +21,40 @@ class NotificationService:
     
     async def schedule_reminder(self, user_id: str, application_id: str, days_from_now: int, message: str):
         """Schedule a reminder"""
-        logger.info("Scheduling reminder", user_id=user_id, days=days_from_now)
+        await self.schedule_reminders_bulk([{
+            "user_id": user_id,
+            "application_id": application_id,
+            "due_at": datetime.utcnow() + timedelta(days=days_from_now),
+            "message": message,
+        }])
+    
+    async def schedule_reminders_bulk(self, reminders: List[Dict[str, Any]]):
+        """
+        Schedule several reminders with one INSERT
+        
+        Reminders are stored as follow-up tasks due at the reminder time.
+        
+        Args:
+            reminders: Dicts with user_id, application_id, due_at and message
+        """
+        if not reminders:
+            return
+        
+        logger.info("Scheduling reminders", user_id=reminders[0]["user_id"], count=len(reminders))
+        
+        rows = [
+            {
+                "user_id": reminder["user_id"],
+                "source": "application_followup",
+                "title": reminder["message"],
+                "description": f"Application {reminder['application_id']}",
+                "due_at": reminder["due_at"],
+            }
+            for reminder in reminders
+        ]
+        
+        async with get_db() as db:
+            await db.execute(insert(Task), rows)
     
     async def send_email(self, user_id: str, subject: str, body: str):
         """Send email notification"""
@@ -3,19 +3,39 @@ Resume service for managing resumes
 """
 
 from typing import Optional
+from sqlalchemy import bindparam, select
 from src.models.database import Resume
 from src.database.session import get_db
 
+# Built once; SQLAlchemy reuses its compiled form for every user_id. Naming
+# content_json loads it despite being deferred on the model.
+CURRENT_RESUME_QUERY = select(
+    Resume.id,
+    Resume.user_id,
+    Resume.title,
+    Resume.doc_url,
+    Resume.content_json,
+    Resume.is_current,
+    Resume.created_at,
+    Resume.updated_at
+).where(
+    Resume.user_id == bindparam("user_id"),
+    Resume.is_current.is_(True)
+).limit(1)
+
 
 class ResumeService:
     """Service for managing resumes"""
     
     async def get_current_resume(self, user_id: str) -> Optional[Resume]:
-        """Get user's current resume"""
+        """
+        Get user's current resume
         
+        Read on every call, not cached: the lookup is one indexed row, and a
+        per-process cache would keep serving a replaced resume in the other
+        workers.
+        """
         async with get_db() as db:
-            resume = await db.query(Resume).filter(
-                Resume.user_id == user_id,
-                Resume.is_current == True
-            ).first()
-            return resume
+            result = await db.execute(CURRENT_RESUME_QUERY, {"user_id": user_id})
+            row = result.mappings().first()
+        return Resume(**row) if row is not None else None
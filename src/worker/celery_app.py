@@ -2,9 +2,35 @@
 Celery worker configuration
 """
 
-from celery import Celery
+import asyncio
+from typing import Optional
+
+from celery import Celery, chord
+from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
+from kombu.serialization import register
+import httpx
+import orjson
 from src.config.settings import settings
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+# orjson encodes task arguments and results (including datetimes and enums)
+# several times faster than the stdlib json serializer
+register(
+    'orjson',
+    orjson.dumps,
+    orjson.loads,
+    content_type='application/x-orjson',
+    content_encoding='binary'
+)
+
+# Longest a pipeline run can take; approval happens after the run, not during it
+PIPELINE_MAX_RUNTIME_SECONDS = 2 * 3600
+
 celery_app = Celery(
     'agentice',
     broker=settings.CELERY_BROKER_URL,
@@ -12,26 +38,155 @@ celery_app = Celery(
 )
 
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='orjson',
+    # Plain json is still accepted from clients that publish with the default
+    accept_content=['orjson', 'json'],
+    result_serializer='orjson',
     timezone='UTC',
     enable_utc=True,
+    # Pipeline tasks run for minutes; reserving one at a time keeps a busy
+    # worker from holding users that an idle worker could start on
+    worker_prefetch_multiplier=1,
+    # Redis redelivers unacked messages after the visibility timeout (1 hour by
+    # default). A task reserved behind a long pipeline run must not be handed
+    # to a second worker meanwhile.
+    broker_transport_options={'visibility_timeout': PIPELINE_MAX_RUNTIME_SECONDS},
+    # Scraping and LLM calls spend their time waiting on the network, so they
+    # get their own queue and never starve other tasks
+    task_routes={
+        'src.worker.celery_app.daily_job_search_for_user': {'queue': 'io'},
+        'pipeline.run_daily': {'queue': 'io'},
+        'pipeline.submit_approved': {'queue': 'io'},
+    },
 )
 
 
+# One event loop per worker process. Tasks run on it instead of asyncio.run,
+# so the HTTP and OpenAI connection pools stay warm between tasks.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _http_client
+    if _loop is None or _loop.is_closed():
+        if uvloop is not None:
+            uvloop.install()
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        from src.services.job_scraper_service import create_http_client
+        _http_client = create_http_client()
+    return _loop
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Pooled HTTP client shared by every task in this worker process"""
+    _get_loop()
+    return _http_client
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the worker's event loop"""
+    return _get_loop().run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    _get_loop()
+    # Builds the shared OpenAI client up front
+    import src.services.llm_service  # noqa: F401
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    from src.services.llm_service import llm_service
+    
+    async def _close_clients():
+        await _http_client.aclose()
+        await llm_service.aclose()
+    
+    _loop.run_until_complete(_close_clients())
+    _loop.close()
+    _loop = None
+
+
 @celery_app.task
 def daily_job_search():
-    """Daily job search task"""
-    from src.pipelines.job_application_pipeline import run_daily_job_search_for_all_users
-    import asyncio
-    asyncio.run(run_daily_job_search_for_all_users())
+    """Daily job search task, fanned out to one task per user"""
+    from src.pipelines.job_application_pipeline import get_auto_apply_user_ids
+    user_ids = run_async(get_auto_apply_user_ids())
+    if not user_ids:
+        return
+    chord(daily_job_search_for_user.s(user_id) for user_id in user_ids)(
+        collect_daily_job_search_results.s()
+    )
+
+
+# rate_limit spreads the fan-out so every user doesn't hit the job boards at
+# once (it applies per worker). Failures are logged by the pipeline rather
+# than retried, and the task is acked when it starts (not late), since a
+# second run could submit the same applications again.
+@celery_app.task(rate_limit='30/m')
+def daily_job_search_for_user(user_id: str):
+    """Daily job search for one user"""
+    from src.pipelines.job_application_pipeline import run_daily_job_search_for_user
+    return run_async(run_daily_job_search_for_user(user_id, http_client=get_http_client()))
+
+
+@celery_app.task
+def collect_daily_job_search_results(summaries):
+    """Log totals once every user's daily job search has finished"""
+    import structlog
+    completed = [summary for summary in summaries if summary]
+    structlog.get_logger().info(
+        "daily_job_search_completed",
+        users=len(summaries),
+        failed=len(summaries) - len(completed),
+        applications_submitted=sum(summary.get("applications_submitted", 0) for summary in completed),
+    )
+
+
+# Batch API jobs finish within 24 hours; check every ten minutes until then
+BATCH_POLL_SECONDS = 600
+
+
+@celery_app.task(bind=True, max_retries=24 * 3600 // BATCH_POLL_SECONDS + 1)
+def collect_job_analysis_batch(self, batch_id: str):
+    """Wait for a submitted job analysis batch without holding a worker"""
+    from src.agents.autogen_chat_agents import get_agent_platform
+    analyses = run_async(get_agent_platform().collect_batch_analysis(batch_id))
+    if analyses is None:
+        raise self.retry(countdown=BATCH_POLL_SECONDS)
+    return analyses
+
+
+@celery_app.task(name="pipeline.run_daily")
+def run_daily_job_search_task(user_id: str, search_criteria=None):
+    """Run one user's job search pipeline off the API workers"""
+    from src.pipelines.job_application_pipeline import JobApplicationPipeline
+    # The summary lists only application ids, companies, titles and statuses
+    return run_async(
+        JobApplicationPipeline(user_id=user_id, http_client=get_http_client()).run_daily_job_search(
+            search_criteria=search_criteria
+        )
+    )
+
+
+# Acked on start like the daily search: a redelivery could submit twice
+@celery_app.task(name="pipeline.submit_approved")
+def submit_approved_application_task(user_id: str, application_id: str):
+    """Submit an application once the user has approved it"""
+    from src.pipelines.job_application_pipeline import submit_approved_application
+    return run_async(submit_approved_application(user_id, application_id, http_client=get_http_client()))
 
 
 # Schedule daily task
 celery_app.conf.beat_schedule = {
     'daily-job-search': {
         'task': 'src.worker.celery_app.daily_job_search',
-        'schedule': 86400.0,  # Run daily (24 hours)
+        'schedule': crontab(hour=2, minute=0),  # Run daily at 02:00 UTC
     },
 }